@@ -1,11 +1,230 @@
 """E2E test configuration and fixtures."""
 
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import time
 from pathlib import Path
 
+import docker
+import docker.errors
+import pytest
+import requests
+from pytest_httpserver import HTTPServer
+from requests.adapters import HTTPAdapter
+from testcontainers.core.container import DockerContainer
+from testcontainers.core.waiting_utils import wait_for_logs
+from werkzeug.wrappers import Request, Response
+from werkzeug.wsgi import wrap_file
+
 # Test configuration
 BASE_IMAGE = "docker.io/nimbletools/mcpb-python:3.14"
 CONTAINER_PORT = 8000
 BUNDLE_NAME = "mcp-openweathermap"
 BUNDLE_VERSION = "0.0.1"
+VENDOR_IMAGE = "ghcr.io/astral-sh/uv:python3.14-bookworm-slim"
 
 PROJECT_ROOT = Path(__file__).parent.parent
+DEPS_CACHE_DIR = Path.home() / ".cache" / "mcp-openweathermap"
+UV_CACHE_DIR = DEPS_CACHE_DIR / "uv"
+
+
+def wait_http_ready(session: requests.Session, url: str, deadline_s: float = 60) -> bool:
+    """Poll url with exponential backoff until it returns 200 or the deadline passes.
+
+    Starts at 50ms between attempts and caps at 2s, so a fast server is detected
+    almost immediately while a slow one still gets the full deadline.
+    """
+    deadline = time.monotonic() + deadline_s
+    delay = 0.05
+    while True:
+        try:
+            if session.get(url, timeout=2).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        if time.monotonic() + delay > deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 1.5, 2.0)
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Shared HTTP session so readiness polls and tests reuse pooled connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    yield session
+
+    session.close()
+
+
+def deps_cache_key() -> str:
+    """Hash the dependency declarations that determine the vendored deps/ tree."""
+    digest = hashlib.sha256()
+    for name in ("pyproject.toml", "uv.lock"):
+        path = PROJECT_ROOT / name
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def vendor_deps() -> Path:
+    """Vendor Linux deps once per dependency set and return the cached directory."""
+    cached_dir = DEPS_CACHE_DIR / f"deps-{deps_cache_key()}"
+    if cached_dir.exists():
+        return cached_dir
+
+    # Vendor into a staging dir and rename on success so a failed run never
+    # leaves a half-populated cache entry behind
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    staging_dir = cached_dir.with_name(f"{cached_dir.name}.{worker}.tmp")
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    staging_dir.mkdir(parents=True)
+    UV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Vendor Linux deps using Docker (matches mcpb-python base image platform).
+    # The uv image saves installing a resolver per run, and its download cache
+    # is persisted so cache misses only fetch what changed.
+    try:
+        docker.from_env().containers.run(
+            VENDOR_IMAGE,
+            ["uv", "pip", "install", "--target", "/deps", "."],
+            volumes={
+                str(PROJECT_ROOT): {"bind": "/work", "mode": "rw"},
+                str(staging_dir): {"bind": "/deps", "mode": "rw"},
+                str(UV_CACHE_DIR): {"bind": "/root/.cache/uv", "mode": "rw"},
+            },
+            working_dir="/work",
+            remove=True,
+        )
+    except docker.errors.ContainerError as e:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        stderr = e.stderr.decode() if e.stderr else str(e)
+        raise RuntimeError(f"Dep vendoring failed: {stderr}") from e
+
+    # Another xdist worker may have populated the same key in the meantime
+    if cached_dir.exists():
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    else:
+        staging_dir.rename(cached_dir)
+    return cached_dir
+
+
+# Top-level entries never needed to pack the bundle; skipped when staging a copy
+_STAGE_SKIP = {".git", ".venv", "deps", ".mypy_cache", ".pytest_cache", ".ruff_cache"}
+
+
+def _skip_for_stage(directory: str, names: list[str]) -> set[str]:
+    """copytree ignore hook: drop caches everywhere and heavy dirs at the project root."""
+    skipped = {name for name in names if name == "__pycache__" or name.endswith(".mcpb")}
+    if Path(directory) == PROJECT_ROOT:
+        skipped |= _STAGE_SKIP.intersection(names)
+    return skipped
+
+
+def build_bundle(output_dir: Path) -> Path:
+    """Build MCPB bundle with Linux-compatible deps for Docker testing.
+
+    The project is packed from a private copy under output_dir, so xdist workers
+    building at the same time never share a deps/ directory.
+    """
+    stage_dir = output_dir / "project"
+    shutil.copytree(PROJECT_ROOT, stage_dir, ignore=_skip_for_stage)
+
+    deps_dir = stage_dir / "deps"
+    shutil.copytree(vendor_deps(), deps_dir)
+
+    # The cache is keyed on dependencies only, so refresh our own package
+    # from src/ to pick up source edits made since the cache was populated
+    package_dir = deps_dir / "mcp_openweathermap"
+    if package_dir.exists():
+        shutil.rmtree(package_dir)
+    shutil.copytree(stage_dir / "src" / "mcp_openweathermap", package_dir)
+
+    # Pack the bundle
+    bundle_path = output_dir / f"{BUNDLE_NAME}-v{BUNDLE_VERSION}.mcpb"
+    result = subprocess.run(
+        ["mcpb", "pack", ".", str(bundle_path)],
+        capture_output=True,
+        text=True,
+        cwd=stage_dir,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Bundle build failed: {result.stderr}")
+
+    if not bundle_path.exists():
+        raise RuntimeError(f"Bundle not found at {bundle_path}")
+
+    # Only the staged copy is removed; the cached deps are kept for reuse
+    shutil.rmtree(stage_dir)
+    return bundle_path
+
+
+@pytest.fixture(scope="session")
+def bundle_path():
+    """Build the MCPB bundle once for all tests."""
+    # Keep the tmpdir alive for the session so the bundle can be served from disk
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield build_bundle(Path(tmpdir))
+
+
+@pytest.fixture(scope="session")
+def bundle_server(bundle_path):
+    """Serve the bundle over HTTP."""
+
+    def send_bundle(request: Request) -> Response:
+        # Stream the file rather than holding the whole bundle in memory
+        return Response(
+            wrap_file(request.environ, bundle_path.open("rb")),
+            content_type="application/octet-stream",
+            direct_passthrough=True,
+        )
+
+    # Start HTTP server on a random port
+    server = HTTPServer(host="0.0.0.0", port=0)
+    server.expect_request(f"/{bundle_path.name}").respond_with_handler(send_bundle)
+    server.start()
+
+    yield server
+
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def mcpb_container(bundle_server, bundle_path, http_session):
+    """Run the MCPB container."""
+    bundle_url = f"http://host.docker.internal:{bundle_server.port}/{bundle_path.name}"
+
+    container = (
+        DockerContainer(BASE_IMAGE)
+        .with_env("BUNDLE_URL", bundle_url)
+        .with_bind_ports(CONTAINER_PORT, None)  # Random host port
+        .with_kwargs(extra_hosts={"host.docker.internal": "host-gateway"})
+    )
+
+    container.start()
+
+    try:
+        # Wait for server to be ready (wait for uvicorn startup message)
+        wait_for_logs(container, "Uvicorn running on", timeout=60)
+
+        # Get the mapped port
+        host_port = container.get_exposed_port(CONTAINER_PORT)
+        base_url = f"http://localhost:{host_port}"
+
+        # Wait for health endpoint
+        if not wait_http_ready(http_session, f"{base_url}/health"):
+            logs = container.get_logs()
+            raise RuntimeError(f"Container not healthy. Logs: {logs}")
+
+        yield base_url
+
+    finally:
+        container.stop()
@@ -13,10 +13,13 @@ import pytest
 from mcp_openweathermap.api_client import OpenWeatherMapAPIError, OpenWeatherMapClient
 
 # Skip all tests if no API key
-pytestmark = pytest.mark.skipif(
-    not os.environ.get("OPENWEATHERMAP_API_KEY"),
-    reason="OPENWEATHERMAP_API_KEY not set",
-)
+pytestmark = [
+    pytest.mark.skipif(
+        not os.environ.get("OPENWEATHERMAP_API_KEY"),
+        reason="OPENWEATHERMAP_API_KEY not set",
+    ),
+    pytest.mark.timeout(30),
+]
 
 
 class TestDirectLocationResolution:
@@ -1,15 +1,20 @@
 """OpenWeatherMap MCP Server - Intent-based weather tools."""
 
-from .api_client import OpenWeatherMapAPIError, OpenWeatherMapClient
-from .api_models import (
-    AirQualityResponse,
-    CurrentWeatherResponse,
-    ForecastResponse,
-    GeocodingResult,
-    OneCallResponse,
-    SolarRadiationData,
-)
-from .server import app, mcp
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Real imports for type checkers; at runtime these resolve lazily via __getattr__
+    from .api_client import OpenWeatherMapAPIError, OpenWeatherMapClient
+    from .api_models import (
+        AirQualityResponse,
+        CurrentWeatherResponse,
+        ForecastResponse,
+        GeocodingResult,
+        OneCallResponse,
+        SolarRadiationData,
+    )
+    from .server import app, mcp
 
 __version__ = "0.4.2"
 
@@ -25,3 +30,31 @@ __all__ = [
     "app",
     "mcp",
 ]
+
+# Exports are imported on first access (PEP 562) so that reading __version__
+# or a single model doesn't pull in the whole FastMCP/server stack
+_LAZY_EXPORTS: dict[str, str] = {
+    "OpenWeatherMapClient": ".api_client",
+    "OpenWeatherMapAPIError": ".api_client",
+    "CurrentWeatherResponse": ".api_models",
+    "ForecastResponse": ".api_models",
+    "AirQualityResponse": ".api_models",
+    "OneCallResponse": ".api_models",
+    "SolarRadiationData": ".api_models",
+    "GeocodingResult": ".api_models",
+    "app": ".server",
+    "mcp": ".server",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,10 +1,20 @@
 """Async API client for OpenWeatherMap API using aiohttp."""
 
+import asyncio
 import os
-from typing import Any
+import re
+import time
+from collections import OrderedDict
+from functools import cache, lru_cache
+from inspect import isclass
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
 
 import aiohttp
 from aiohttp import ClientError
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+from yarl import URL
 
 from .api_models import (
     AirQualityResponse,
@@ -14,6 +24,126 @@ from .api_models import (
     OneCallResponse,
 )
 
+# Built once at import; validates the geocoding list straight from JSON bytes
+_GEOCODING_RESULTS = TypeAdapter(list[GeocodingResult])
+
+# Maximum number of distinct (location, limit) lookups kept in the geocoding cache
+GEOCODE_CACHE_SIZE = 512
+
+# How long a geocoding result is reused before the place name is looked up again
+GEOCODE_CACHE_TTL_SECONDS = 86400.0
+
+# How long a failed One Call probe is remembered before trying One Call again
+ONE_CALL_RECHECK_SECONDS = 3600.0
+
+# Weather data updates upstream roughly every 10 minutes, so successful GET
+# responses are reused for that long; at most RESPONSE_CACHE_SIZE are kept, and
+# least recently used bodies are evicted once they total RESPONSE_CACHE_MAX_BYTES
+RESPONSE_CACHE_TTL_SECONDS = 600.0
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Endpoints that change faster or slower than that get their own TTL: current
+# conditions are refreshed more often, One Call carries minute-level precipitation
+# and alerts, and historical (timemachine) data never changes
+CURRENT_WEATHER_CACHE_TTL_SECONDS = 300.0
+ONE_CALL_CACHE_TTL_SECONDS = 60.0
+TIMEMACHINE_CACHE_TTL_SECONDS = 86400.0
+
+# Maximum number of concurrent requests issued by get_weather_bulk
+BULK_CONCURRENCY = 20
+
+# "lat,lon" with optional whitespace around either number, e.g. "51.5,-0.1" or "51.5, -0.1"
+_NUMBER = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)"
+_COORD_RE = re.compile(rf"^\s*({_NUMBER})\s*,\s*({_NUMBER})\s*$")
+
+
+@lru_cache(maxsize=2048)
+def _coord(value: float) -> str:
+    """Format a coordinate query parameter, memoized for frequently repeated locations."""
+    return repr(float(value))
+
+
+@lru_cache(maxsize=64)
+def _parsed_url(url: str) -> URL:
+    """Parse an endpoint URL once; aiohttp takes URL objects without re-parsing them."""
+    return URL(url)
+
+
+def _in_range(lat: float, lon: float) -> bool:
+    """Return whether lat/lon are valid WGS84 coordinates."""
+    return -90 <= lat <= 90 and -180 <= lon <= 180
+
+
+def _discard(task: asyncio.Future[Any]) -> None:
+    """Stop waiting on a task whose result is no longer needed.
+
+    Only the caller is cancelled: the HTTP request it made through _request_bytes
+    is shielded, so it still completes and a successful body lands in the
+    response cache for the next caller.
+    """
+    task.cancel()
+    # Retrieve its exception if it already failed, so asyncio doesn't log it as unhandled
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+def _extract_error_message(result: Any) -> str:
+    """Pull the human-readable message out of an API error body."""
+    if isinstance(result, dict):
+        if message := result.get("message"):
+            return str(message)
+        error = result.get("error")
+        if isinstance(error, dict) and (message := error.get("message")):
+            return str(message)
+        if error is not None:
+            return str(error)
+    return "Unknown error"
+
+
+def _nested_model(annotation: Any) -> tuple[type[BaseModel] | None, bool]:
+    """Return the model type held by a field annotation and whether it is a list of them."""
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        non_none = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _nested_model(non_none[0]) if len(non_none) == 1 else (None, False)
+    if origin is list:
+        (item,) = get_args(annotation)
+        nested, _ = _nested_model(item)
+        return nested, nested is not None
+    if isclass(annotation) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+@cache
+def _field_plan(model: type[BaseModel]) -> dict[str, tuple[type[BaseModel] | None, bool]]:
+    """Map each input key of a model to its nested model type, computed once per class."""
+    return {
+        field.alias or name: _nested_model(field.annotation)
+        for name, field in model.model_fields.items()
+    }
+
+
+def _construct_trusted[ModelT: BaseModel](model: type[ModelT], data: dict[str, Any]) -> ModelT:
+    """Build a model tree from trusted JSON data without running validation.
+
+    Unlike a bare model_construct, nested models are constructed too, so the result
+    behaves like a validated instance as long as the upstream schema hasn't drifted.
+    """
+    plan = _field_plan(model)
+    values: dict[str, Any] = {}
+    for key, value in data.items():
+        if key not in plan:
+            continue
+        nested, is_list = plan[key]
+        if nested is not None and value is not None:
+            if is_list:
+                value = [_construct_trusted(nested, item) for item in value]
+            else:
+                value = _construct_trusted(nested, value)
+        values[key] = value
+    return model.model_construct(**values)
+
 
 class OpenWeatherMapAPIError(Exception):
     """Custom exception for OpenWeatherMap API errors."""
@@ -35,31 +165,70 @@ class OpenWeatherMapClient:
         geo_url: str = "https://api.openweathermap.org/geo/1.0",
         onecall_url: str = "https://api.openweathermap.org/data/3.0",
         timeout: float = 30.0,
+        trust_upstream: bool | None = None,
     ) -> None:
         self.api_key = api_key or os.environ.get("OPENWEATHERMAP_API_KEY")
         self.base_url = base_url.rstrip("/")
         self.geo_url = geo_url.rstrip("/")
         self.onecall_url = onecall_url.rstrip("/")
         self.timeout = timeout
+        # Build response models without validation. Faster, but upstream schema
+        # drift is no longer caught. Opt in with OWM_TRUST_UPSTREAM=1.
+        if trust_upstream is None:
+            trust_upstream = os.environ.get("OWM_TRUST_UPSTREAM") == "1"
+        self.trust_upstream = trust_upstream
+
+        # Endpoint URLs and the appid param are fixed for the client's lifetime,
+        # so build them once instead of on every request
+        self._weather_url = f"{self.base_url}/weather"
+        self._forecast_url = f"{self.base_url}/forecast"
+        self._air_pollution_url = f"{self.base_url}/air_pollution"
+        self._onecall_url = f"{self.onecall_url}/onecall"
+        self._timemachine_url = f"{self.onecall_url}/onecall/timemachine"
+        self._geocode_url = f"{self.geo_url}/direct"
+        self._base_params: dict[str, Any] = {"appid": self.api_key} if self.api_key else {}
+        # URLs not listed here use RESPONSE_CACHE_TTL_SECONDS
+        self._cache_ttls: dict[str, float] = {
+            self._weather_url: CURRENT_WEATHER_CACHE_TTL_SECONDS,
+            self._onecall_url: ONE_CALL_CACHE_TTL_SECONDS,
+            self._timemachine_url: TIMEMACHINE_CACHE_TTL_SECONDS,
+        }
+
         self._session: aiohttp.ClientSession | None = None
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[bytes]] = {}
+        self._response_cache: OrderedDict[tuple[Any, ...], tuple[float, bytes]] = OrderedDict()
+        self._response_cache_bytes = 0
+        self._one_call_available: bool | None = None
+        self._one_call_checked_at = 0.0
+        self._geocode_cache: OrderedDict[tuple[str, int], tuple[float, list[GeocodingResult]]] = (
+            OrderedDict()
+        )
 
     async def __aenter__(self) -> "OpenWeatherMapClient":
-        await self._ensure_session()
+        if self._session is None:
+            await self._create_session()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         await self.close()
 
-    async def _ensure_session(self) -> None:
-        """Create session if it doesn't exist."""
-        if not self._session:
-            headers = {
-                "User-Agent": "mcp-server-openweathermap/1.0",
-                "Accept": "application/json",
-            }
-            self._session = aiohttp.ClientSession(
-                headers=headers, timeout=aiohttp.ClientTimeout(total=self.timeout)
-            )
+    async def _create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session and return it."""
+        # Accept-Encoding is left to aiohttp: it already asks for gzip/deflate (plus br
+        # when Brotli is installed) and inflates the compressed bodies transparently
+        headers = {
+            "User-Agent": "mcp-server-openweathermap/1.0",
+            "Accept": "application/json",
+        }
+        # Keep connections to api.openweathermap.org alive between calls so
+        # back-to-back requests skip the TCP + TLS handshake
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=75)
+        self._session = aiohttp.ClientSession(
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=connector,
+        )
+        return self._session
 
     async def close(self) -> None:
         """Close the session."""
@@ -67,64 +236,146 @@ class OpenWeatherMapClient:
             await self._session.close()
             self._session = None
 
-    async def _request(
+    async def _request_bytes(
         self,
         method: str,
         url: str,
         params: dict[str, Any] | None = None,
-        json_data: Any | None = None,
-    ) -> dict[str, Any]:
-        """Make HTTP request with error handling."""
-        await self._ensure_session()
+    ) -> bytes:
+        """Make HTTP request and return the raw response body.
 
-        # Add API key to params
-        if params is None:
-            params = {}
-        if self.api_key:
-            params["appid"] = self.api_key
+        Callers build params from self._base_params so the API key is included.
+        Successful bodies are returned untouched so callers can hand them straight
+        to Pydantic's JSON validator; only error bodies are parsed here.
+
+        Identical requests issued while one is already in flight share its
+        result instead of hitting the API again, and successful GET bodies are
+        reused for the endpoint's TTL (RESPONSE_CACHE_TTL_SECONDS by default).
+        """
+        # Checked inline so the common case doesn't await a coroutine per request
+        session = self._session
+        if session is None:
+            session = await self._create_session()
 
-        kwargs: dict[str, Any] = {}
-        if json_data is not None:
-            kwargs["json"] = json_data
+        if params is None:
+            params = dict(self._base_params)
+
+        key = (method, url, tuple(sorted(params.items())))
+        if method == "GET":
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                expires_at, cached_body = cached
+                if time.monotonic() < expires_at:
+                    self._response_cache.move_to_end(key)
+                    return cached_body
+                self._uncache_response(key)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(session, key, method, url, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # Every caller may have been cancelled by the time it fails, so read the
+            # exception here or asyncio logs it as never retrieved
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        key: tuple[Any, ...],
+        method: str,
+        url: str,
+        params: dict[str, Any],
+    ) -> bytes:
+        """Send a shared request and cache its body if it is a successful GET.
 
+        This runs as the in-flight task rather than in a caller, so the body is
+        still cached when every caller was cancelled while it loaded.
+        """
+        body = await self._send(session, method, url, params)
+        if method == "GET":
+            self._cache_response(key, url, body)
+        return body
+
+    def _cache_response(self, key: tuple[Any, ...], url: str, body: bytes) -> None:
+        """Store a response body, evicting least recently used ones to stay within budget."""
+        self._uncache_response(key)
+        now = time.monotonic()
+        # TTLs differ per endpoint (60s to 24h), so recency alone would keep expired
+        # short-lived bodies around behind long-lived ones; drop those first
+        expired = [k for k, (expires_at, _) in self._response_cache.items() if expires_at <= now]
+        for expired_key in expired:
+            self._uncache_response(expired_key)
+        ttl = self._cache_ttls.get(url, RESPONSE_CACHE_TTL_SECONDS)
+        self._response_cache[key] = (now + ttl, body)
+        self._response_cache_bytes += len(body)
+        while self._response_cache and (
+            len(self._response_cache) > RESPONSE_CACHE_SIZE
+            or self._response_cache_bytes > RESPONSE_CACHE_MAX_BYTES
+        ):
+            _, (_, evicted) = self._response_cache.popitem(last=False)
+            self._response_cache_bytes -= len(evicted)
+
+    def _uncache_response(self, key: tuple[Any, ...]) -> None:
+        """Drop a cached response body, if present."""
+        entry = self._response_cache.pop(key, None)
+        if entry is not None:
+            self._response_cache_bytes -= len(entry[1])
+
+    async def _send(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        params: dict[str, Any],
+    ) -> bytes:
+        """Perform a single HTTP request, raising OpenWeatherMapAPIError on failure."""
         try:
-            if not self._session:
-                raise RuntimeError("Session not initialized")
-
-            async with self._session.request(method, url, params=params, **kwargs) as response:
-                content_type = response.headers.get("Content-Type", "")
-
-                if "application/json" in content_type:
-                    result = await response.json()
-                else:
-                    text = await response.text()
-                    # Try to parse as JSON
-                    if text.startswith("{") or text.startswith("["):
-                        import json
-
-                        try:
-                            result = json.loads(text)
-                        except json.JSONDecodeError:
-                            result = {"result": text}
-                    else:
-                        result = {"result": text}
+            async with session.request(method, _parsed_url(url), params=params) as response:
+                body = await response.read()
 
                 # Check for errors
                 if response.status >= 400:
-                    error_msg = "Unknown error"
-                    if isinstance(result, dict):
-                        error_msg = (
-                            result.get("message")
-                            or result.get("error", {}).get("message")
-                            or str(result.get("error", error_msg))
-                        )
-                    raise OpenWeatherMapAPIError(response.status, error_msg, result)
+                    result = self._parse_body(body)
+                    raise OpenWeatherMapAPIError(
+                        response.status, _extract_error_message(result), result
+                    )
 
-                return result
+                return body
 
         except ClientError as e:
             raise OpenWeatherMapAPIError(500, f"Network error: {str(e)}") from e
 
+    @staticmethod
+    def _parse_body(body: bytes) -> Any:
+        """Parse a response body as JSON, falling back to the raw text."""
+        try:
+            return from_json(body)
+        except ValueError:
+            return {"result": body.decode(errors="replace")}
+
+    async def _get_model[ModelT: BaseModel](
+        self, url: str, params: dict[str, Any], model: type[ModelT]
+    ) -> ModelT:
+        """GET an endpoint and build its response model straight from the body bytes.
+
+        When trust_upstream is on, the model tree is constructed without validation.
+        """
+        body = await self._request_bytes("GET", url, params=params)
+        if self.trust_upstream:
+            return _construct_trusted(model, from_json(body))
+        return model.model_validate_json(body)
+
+    async def _get_json(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        """GET an endpoint and return its decoded JSON body."""
+        body = await self._request_bytes("GET", url, params=params)
+        # Payloads repeat the same few dozen keys hundreds of times (hourly/daily
+        # lists), so have the decoder reuse one str object per distinct key
+        result: dict[str, Any] = from_json(body, cache_strings="keys")
+        return result
+
     async def get_current_weather(
         self, lat: float, lon: float, units: str = "metric"
     ) -> CurrentWeatherResponse:
@@ -138,9 +389,53 @@ class OpenWeatherMapClient:
         Returns:
             Current weather data
         """
-        params = {"lat": lat, "lon": lon, "units": units}
-        data = await self._request("GET", f"{self.base_url}/weather", params=params)
-        return CurrentWeatherResponse(**data)
+        params = {**self._base_params, "lat": _coord(lat), "lon": _coord(lon), "units": units}
+        return await self._get_model(self._weather_url, params, CurrentWeatherResponse)
+
+    async def get_current_weather_raw(
+        self, lat: float, lon: float, units: str = "metric"
+    ) -> dict[str, Any]:
+        """Get current weather as the decoded API JSON, without building models.
+
+        Args:
+            lat: Latitude coordinate
+            lon: Longitude coordinate
+            units: Units of measurement (metric, imperial, standard)
+
+        Returns:
+            Current weather data as returned by the API
+        """
+        params = {**self._base_params, "lat": _coord(lat), "lon": _coord(lon), "units": units}
+        return await self._get_json(self._weather_url, params)
+
+    async def get_weather_bulk(
+        self, coords: list[tuple[float, float]], units: str = "metric"
+    ) -> list[CurrentWeatherResponse]:
+        """Get current weather for several coordinates concurrently.
+
+        Requests share the pooled session, with at most BULK_CONCURRENCY in flight.
+
+        Args:
+            coords: List of (latitude, longitude) pairs
+            units: Units of measurement (metric, imperial, standard)
+
+        Returns:
+            Current weather data, in the same order as coords
+
+        Raises:
+            OpenWeatherMapAPIError: If any pair is out of range; no requests are made
+        """
+        invalid = [(lat, lon) for lat, lon in coords if not _in_range(lat, lon)]
+        if invalid:
+            raise OpenWeatherMapAPIError(400, f"Invalid coordinates: {invalid}")
+
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def fetch(lat: float, lon: float) -> CurrentWeatherResponse:
+            async with semaphore:
+                return await self.get_current_weather(lat, lon, units)
+
+        return list(await asyncio.gather(*(fetch(lat, lon) for lat, lon in coords)))
 
     async def get_forecast(
         self, lat: float, lon: float, units: str = "metric", cnt: int | None = None
@@ -156,11 +451,39 @@ class OpenWeatherMapClient:
         Returns:
             5-day forecast data
         """
-        params: dict[str, Any] = {"lat": lat, "lon": lon, "units": units}
+        params: dict[str, Any] = {
+            **self._base_params,
+            "lat": _coord(lat),
+            "lon": _coord(lon),
+            "units": units,
+        }
         if cnt is not None:
             params["cnt"] = cnt
-        data = await self._request("GET", f"{self.base_url}/forecast", params=params)
-        return ForecastResponse(**data)
+        return await self._get_model(self._forecast_url, params, ForecastResponse)
+
+    async def get_forecast_raw(
+        self, lat: float, lon: float, units: str = "metric", cnt: int | None = None
+    ) -> dict[str, Any]:
+        """Get the 5-day forecast as the decoded API JSON, without building models.
+
+        Args:
+            lat: Latitude coordinate
+            lon: Longitude coordinate
+            units: Units of measurement (metric, imperial, standard)
+            cnt: Number of timestamps to return (max: 40)
+
+        Returns:
+            5-day forecast data as returned by the API
+        """
+        params: dict[str, Any] = {
+            **self._base_params,
+            "lat": _coord(lat),
+            "lon": _coord(lon),
+            "units": units,
+        }
+        if cnt is not None:
+            params["cnt"] = cnt
+        return await self._get_json(self._forecast_url, params)
 
     async def get_air_quality(self, lat: float, lon: float) -> AirQualityResponse:
         """Get air quality index and pollutant data.
@@ -172,9 +495,21 @@ class OpenWeatherMapClient:
         Returns:
             Air quality data with AQI and pollutant concentrations
         """
-        params = {"lat": lat, "lon": lon}
-        data = await self._request("GET", f"{self.base_url}/air_pollution", params=params)
-        return AirQualityResponse(**data)
+        params = {**self._base_params, "lat": _coord(lat), "lon": _coord(lon)}
+        return await self._get_model(self._air_pollution_url, params, AirQualityResponse)
+
+    async def get_air_quality_raw(self, lat: float, lon: float) -> dict[str, Any]:
+        """Get air quality data as the decoded API JSON, without building models.
+
+        Args:
+            lat: Latitude coordinate
+            lon: Longitude coordinate
+
+        Returns:
+            Air quality data as returned by the API
+        """
+        params = {**self._base_params, "lat": _coord(lat), "lon": _coord(lon)}
+        return await self._get_json(self._air_pollution_url, params)
 
     async def get_one_call(
         self, lat: float, lon: float, exclude: str | None = None
@@ -189,11 +524,34 @@ class OpenWeatherMapClient:
         Returns:
             Comprehensive weather data including current, forecasts, and alerts
         """
-        params: dict[str, Any] = {"lat": lat, "lon": lon}
+        params: dict[str, Any] = {**self._base_params, "lat": _coord(lat), "lon": _coord(lon)}
         if exclude:
             params["exclude"] = exclude
-        data = await self._request("GET", f"{self.onecall_url}/onecall", params=params)
-        return OneCallResponse(**data)
+        return await self._get_model(self._onecall_url, params, OneCallResponse)
+
+    async def get_one_call_raw(
+        self, lat: float, lon: float, units: str = "metric", exclude: str | None = None
+    ) -> dict[str, Any]:
+        """Get One Call API 3.0 data as the decoded API JSON, without building models.
+
+        Args:
+            lat: Latitude coordinate
+            lon: Longitude coordinate
+            units: Units of measurement (metric, imperial, standard)
+            exclude: Comma-separated list to exclude (current, minutely, hourly, daily, alerts)
+
+        Returns:
+            Comprehensive weather data as returned by the API
+        """
+        params: dict[str, Any] = {
+            **self._base_params,
+            "lat": _coord(lat),
+            "lon": _coord(lon),
+            "units": units,
+        }
+        if exclude:
+            params["exclude"] = exclude
+        return await self._get_json(self._onecall_url, params)
 
     async def geocode_location(self, location_name: str, limit: int = 5) -> list[GeocodingResult]:
         """Geocode a location name to coordinates.
@@ -205,11 +563,29 @@ class OpenWeatherMapClient:
         Returns:
             List of geocoding results with coordinates
         """
-        params = {"q": location_name, "limit": limit}
-        data = await self._request("GET", f"{self.geo_url}/direct", params=params)
-        if isinstance(data, list):
-            return [GeocodingResult(**item) for item in data]
-        return []
+        # Place names resolve to the same coordinates, so repeat lookups are
+        # served from a bounded LRU (with a TTL) instead of another round-trip
+        cache_key = (location_name.strip().casefold(), limit)
+        now = time.monotonic()
+        cached = self._geocode_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_results = cached
+            if now < expires_at:
+                self._geocode_cache.move_to_end(cache_key)
+                return list(cached_results)
+            del self._geocode_cache[cache_key]
+
+        params = {**self._base_params, "q": location_name, "limit": limit}
+        body = await self._request_bytes("GET", self._geocode_url, params=params)
+        if self.trust_upstream:
+            results = [_construct_trusted(GeocodingResult, item) for item in from_json(body)]
+        else:
+            results = _GEOCODING_RESULTS.validate_json(body)
+
+        self._geocode_cache[cache_key] = (now + GEOCODE_CACHE_TTL_SECONDS, results)
+        if len(self._geocode_cache) > GEOCODE_CACHE_SIZE:
+            self._geocode_cache.popitem(last=False)
+        return list(results)
 
     async def get_weather_by_city(self, city: str, units: str = "metric") -> CurrentWeatherResponse:
         """Get current weather by city name.
@@ -221,9 +597,8 @@ class OpenWeatherMapClient:
         Returns:
             Current weather data
         """
-        params = {"q": city, "units": units}
-        data = await self._request("GET", f"{self.base_url}/weather", params=params)
-        return CurrentWeatherResponse(**data)
+        params = {**self._base_params, "q": city, "units": units}
+        return await self._get_model(self._weather_url, params, CurrentWeatherResponse)
 
     async def get_forecast_by_city(
         self, city: str, units: str = "metric", cnt: int | None = None
@@ -238,11 +613,10 @@ class OpenWeatherMapClient:
         Returns:
             5-day forecast data
         """
-        params: dict[str, Any] = {"q": city, "units": units}
+        params: dict[str, Any] = {**self._base_params, "q": city, "units": units}
         if cnt is not None:
             params["cnt"] = cnt
-        data = await self._request("GET", f"{self.base_url}/forecast", params=params)
-        return ForecastResponse(**data)
+        return await self._get_model(self._forecast_url, params, ForecastResponse)
 
     async def get_one_call_timemachine(
         self, lat: float, lon: float, dt: int, units: str = "metric"
@@ -258,11 +632,37 @@ class OpenWeatherMapClient:
         Returns:
             Historical weather data
         """
-        params: dict[str, Any] = {"lat": lat, "lon": lon, "dt": dt, "units": units}
-        data = await self._request(
-            "GET", f"{self.onecall_url}/onecall/timemachine", params=params
-        )
-        return OneCallResponse(**data)
+        params: dict[str, Any] = {
+            **self._base_params,
+            "lat": _coord(lat),
+            "lon": _coord(lon),
+            "dt": dt,
+            "units": units,
+        }
+        return await self._get_model(self._timemachine_url, params, OneCallResponse)
+
+    async def get_one_call_timemachine_raw(
+        self, lat: float, lon: float, dt: int, units: str = "metric"
+    ) -> dict[str, Any]:
+        """Get historical weather as the decoded API JSON, without building models.
+
+        Args:
+            lat: Latitude coordinate
+            lon: Longitude coordinate
+            dt: Unix timestamp (UTC) for the historical date
+            units: Units of measurement (metric, imperial, standard)
+
+        Returns:
+            Historical weather data as returned by the API
+        """
+        params: dict[str, Any] = {
+            **self._base_params,
+            "lat": _coord(lat),
+            "lon": _coord(lon),
+            "dt": dt,
+            "units": units,
+        }
+        return await self._get_json(self._timemachine_url, params)
 
     async def resolve_location(self, location: str) -> tuple[float, float]:
         """Resolve location to coordinates. Accepts:
@@ -279,16 +679,11 @@ class OpenWeatherMapClient:
             OpenWeatherMapAPIError: If location cannot be resolved
         """
         # Check if already coordinates (format: "lat,lon" or "lat, lon")
-        if "," in location:
-            parts = location.split(",")
-            if len(parts) == 2:
-                try:
-                    lat = float(parts[0].strip())
-                    lon = float(parts[1].strip())
-                    if -90 <= lat <= 90 and -180 <= lon <= 180:
-                        return lat, lon
-                except ValueError:
-                    pass  # Not coordinates, try geocoding
+        match = _COORD_RE.match(location)
+        if match:
+            lat, lon = float(match[1]), float(match[2])
+            if _in_range(lat, lon):
+                return lat, lon
 
         # Geocode the location name
         results = await self.geocode_location(location, limit=1)
@@ -302,7 +697,9 @@ class OpenWeatherMapClient:
         """Get forecast with graceful degradation.
 
         Tries One Call API first for rich data (hourly, daily, alerts).
-        Falls back to free 5-day forecast on 401/403 errors.
+        Falls back to free 5-day forecast on 401/403 errors, and remembers that
+        result for ONE_CALL_RECHECK_SECONDS so later calls skip the failing probe.
+        While the key's tier is unknown, both are requested concurrently.
 
         Args:
             lat: Latitude coordinate
@@ -312,37 +709,55 @@ class OpenWeatherMapClient:
         Returns:
             Forecast data with 'source' field indicating data tier
         """
+        # Once a 401/403 shows the key has no One Call subscription, go straight to
+        # the free tier; re-probe after a while in case the subscription changes
+        if (
+            self._one_call_available is False
+            and time.monotonic() - self._one_call_checked_at < ONE_CALL_RECHECK_SECONDS
+        ):
+            return await self._get_free_tier_forecast(lat, lon, units)
+
+        # Until One Call is known to work for this key, fetch the free forecast
+        # alongside it so an unsubscribed key doesn't pay two round-trips in a row
+        speculative: asyncio.Future[dict[str, Any]] | None = None
+        if self._one_call_available is not True:
+            speculative = asyncio.ensure_future(self._get_free_tier_forecast(lat, lon, units))
+
         try:
-            one_call_data = await self.get_one_call(lat, lon)
-            return {
-                "source": "one_call",
-                "current": one_call_data.current,
-                "hourly": (
-                    [h.model_dump() for h in one_call_data.hourly]
-                    if one_call_data.hourly
-                    else None
-                ),
-                "daily": (
-                    [d.model_dump() for d in one_call_data.daily]
-                    if one_call_data.daily
-                    else None
-                ),
-                "alerts": (
-                    [a.model_dump() for a in one_call_data.alerts]
-                    if one_call_data.alerts
-                    else []
-                ),
-                "timezone": one_call_data.timezone,
-            }
+            one_call = await self.get_one_call_raw(lat, lon, units)
         except OpenWeatherMapAPIError as e:
             if e.status in (401, 403):
+                self._one_call_available = False
+                self._one_call_checked_at = time.monotonic()
                 # Fall back to free tier
-                forecast_data = await self.get_forecast(lat, lon, units)
-                return {
-                    "source": "free_tier",
-                    "forecast_list": [f.model_dump() for f in forecast_data.forecast_list],
-                    "city": forecast_data.city.model_dump(),
-                    "alerts": [],
-                    "note": "Hourly forecast and alerts require One Call API subscription",
-                }
+                if speculative is None:
+                    return await self._get_free_tier_forecast(lat, lon, units)
+                free_tier, speculative = speculative, None
+                return await free_tier
             raise
+        finally:
+            if speculative is not None:
+                _discard(speculative)
+
+        # The result is plain JSON-ready data, so pass the decoded payload through
+        # rather than validating it into models only to dump them straight back
+        self._one_call_available = True
+        return {
+            "source": "one_call",
+            "current": one_call.get("current"),
+            "hourly": one_call.get("hourly") or None,
+            "daily": one_call.get("daily") or None,
+            "alerts": one_call.get("alerts") or [],
+            "timezone": one_call.get("timezone"),
+        }
+
+    async def _get_free_tier_forecast(self, lat: float, lon: float, units: str) -> dict[str, Any]:
+        """Get the free 5-day forecast in the get_forecast_with_fallback result shape."""
+        forecast = await self.get_forecast_raw(lat, lon, units)
+        return {
+            "source": "free_tier",
+            "forecast_list": forecast["list"],
+            "city": forecast["city"],
+            "alerts": [],
+            "note": "Hourly forecast and alerts require One Call API subscription",
+        }
@@ -1,18 +1,23 @@
 """Pydantic models for OpenWeatherMap API responses."""
 
-from typing import Any
+from pydantic import BaseModel, ConfigDict, Field
 
-from pydantic import BaseModel, Field
 
+class ResponseModel(BaseModel):
+    """Base for API response models: immutable, populated by field name or alias."""
 
-class Coordinates(BaseModel):
+    # Frozen so instances shared through the client's caches can't be mutated
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+
+class Coordinates(ResponseModel):
     """Geographic coordinates."""
 
     lon: float = Field(..., description="Longitude")
     lat: float = Field(..., description="Latitude")
 
 
-class WeatherCondition(BaseModel):
+class WeatherCondition(ResponseModel):
     """Weather condition details."""
 
     id: int = Field(..., description="Weather condition ID")
@@ -21,7 +26,7 @@ class WeatherCondition(BaseModel):
     icon: str = Field(..., description="Weather icon ID")
 
 
-class Temperature(BaseModel):
+class Temperature(ResponseModel):
     """Temperature data."""
 
     temp: float = Field(..., description="Current temperature")
@@ -34,7 +39,7 @@ class Temperature(BaseModel):
     grnd_level: int | None = Field(None, description="Ground level atmospheric pressure (hPa)")
 
 
-class Wind(BaseModel):
+class Wind(ResponseModel):
     """Wind data."""
 
     speed: float = Field(..., description="Wind speed")
@@ -42,13 +47,13 @@ class Wind(BaseModel):
     gust: float | None = Field(None, description="Wind gust speed")
 
 
-class Clouds(BaseModel):
+class Clouds(ResponseModel):
     """Cloud data."""
 
     all: int = Field(..., description="Cloudiness percentage")
 
 
-class Rain(BaseModel):
+class Rain(ResponseModel):
     """Rain data."""
 
     one_hour: float | None = Field(None, alias="1h", description="Rain volume for last 1 hour (mm)")
@@ -57,7 +62,7 @@ class Rain(BaseModel):
     )
 
 
-class Snow(BaseModel):
+class Snow(ResponseModel):
     """Snow data."""
 
     one_hour: float | None = Field(None, alias="1h", description="Snow volume for last 1 hour (mm)")
@@ -66,7 +71,7 @@ class Snow(BaseModel):
     )
 
 
-class SystemData(BaseModel):
+class SystemData(ResponseModel):
     """System data."""
 
     type: int | None = Field(None, description="Internal parameter")
@@ -76,7 +81,7 @@ class SystemData(BaseModel):
     sunset: int | None = Field(None, description="Sunset time (Unix, UTC)")
 
 
-class CurrentWeatherResponse(BaseModel):
+class CurrentWeatherResponse(ResponseModel):
     """Response model for current weather endpoint."""
 
     coord: Coordinates = Field(..., description="Geographic coordinates")
@@ -96,7 +101,13 @@ class CurrentWeatherResponse(BaseModel):
     cod: int = Field(..., description="HTTP status code")
 
 
-class ForecastItem(BaseModel):
+class ForecastSys(ResponseModel):
+    """Forecast data point system data."""
+
+    pod: str | None = Field(None, description="Part of the day (n=night, d=day)")
+
+
+class ForecastItem(ResponseModel):
     """Individual forecast data point."""
 
     dt: int = Field(..., description="Data calculation time (Unix, UTC)")
@@ -108,11 +119,11 @@ class ForecastItem(BaseModel):
     pop: float | None = Field(None, description="Probability of precipitation (0-1)")
     rain: Rain | None = Field(None, description="Rain data")
     snow: Snow | None = Field(None, description="Snow data")
-    sys: dict[str, Any] | None = Field(None, description="System data")
+    sys: ForecastSys | None = Field(None, description="System data")
     dt_txt: str | None = Field(None, description="Forecast time in text format")
 
 
-class City(BaseModel):
+class City(ResponseModel):
     """City information in forecast."""
 
     id: int = Field(..., description="City ID")
@@ -125,7 +136,7 @@ class City(BaseModel):
     sunset: int = Field(..., description="Sunset time (Unix, UTC)")
 
 
-class ForecastResponse(BaseModel):
+class ForecastResponse(ResponseModel):
     """Response model for 5-day/3-hour forecast endpoint."""
 
     cod: str = Field(..., description="HTTP status code")
@@ -135,7 +146,7 @@ class ForecastResponse(BaseModel):
     city: City = Field(..., description="City information")
 
 
-class AirQualityComponents(BaseModel):
+class AirQualityComponents(ResponseModel):
     """Air quality pollutant components."""
 
     co: float = Field(..., description="Carbon monoxide (μg/m³)")
@@ -148,13 +159,13 @@ class AirQualityComponents(BaseModel):
     nh3: float = Field(..., description="Ammonia (μg/m³)")
 
 
-class AirQualityMain(BaseModel):
+class AirQualityMain(ResponseModel):
     """Air quality index."""
 
     aqi: int = Field(..., description="Air Quality Index (1=Good, 5=Very Poor)")
 
 
-class AirQualityItem(BaseModel):
+class AirQualityItem(ResponseModel):
     """Air quality data item."""
 
     main: AirQualityMain = Field(..., description="Air quality index")
@@ -162,14 +173,14 @@ class AirQualityItem(BaseModel):
     dt: int = Field(..., description="Data calculation time (Unix, UTC)")
 
 
-class AirQualityResponse(BaseModel):
+class AirQualityResponse(ResponseModel):
     """Response model for air quality endpoint."""
 
     coord: Coordinates = Field(..., description="Geographic coordinates")
     items: list[AirQualityItem] = Field(..., description="Air quality data", alias="list")
 
 
-class UVIndexResponse(BaseModel):
+class UVIndexResponse(ResponseModel):
     """Response model for UV index endpoint."""
 
     lat: float = Field(..., description="Latitude")
@@ -179,14 +190,36 @@ class UVIndexResponse(BaseModel):
     value: float = Field(..., description="UV index value")
 
 
-class MinutelyForecast(BaseModel):
+class MinutelyForecast(ResponseModel):
     """Minutely forecast data."""
 
     dt: int = Field(..., description="Time (Unix, UTC)")
     precipitation: float = Field(..., description="Precipitation volume (mm)")
 
 
-class HourlyForecast(BaseModel):
+class CurrentConditions(ResponseModel):
+    """Current weather data from One Call API."""
+
+    dt: int = Field(..., description="Current time (Unix, UTC)")
+    sunrise: int | None = Field(None, description="Sunrise time (Unix, UTC)")
+    sunset: int | None = Field(None, description="Sunset time (Unix, UTC)")
+    temp: float = Field(..., description="Temperature")
+    feels_like: float = Field(..., description="Feels like temperature")
+    pressure: int = Field(..., description="Atmospheric pressure (hPa)")
+    humidity: int = Field(..., description="Humidity percentage")
+    dew_point: float = Field(..., description="Dew point temperature")
+    uvi: float = Field(..., description="UV index")
+    clouds: int = Field(..., description="Cloudiness percentage")
+    visibility: int | None = Field(None, description="Visibility in meters")
+    wind_speed: float = Field(..., description="Wind speed")
+    wind_deg: int = Field(..., description="Wind direction in degrees")
+    wind_gust: float | None = Field(None, description="Wind gust speed")
+    weather: list[WeatherCondition] = Field(..., description="Weather conditions")
+    rain: dict[str, float] | None = Field(None, description="Rain data")
+    snow: dict[str, float] | None = Field(None, description="Snow data")
+
+
+class HourlyForecast(ResponseModel):
     """Hourly forecast data."""
 
     dt: int = Field(..., description="Time (Unix, UTC)")
@@ -207,7 +240,7 @@ class HourlyForecast(BaseModel):
     snow: dict[str, float] | None = Field(None, description="Snow data")
 
 
-class DailyTemperature(BaseModel):
+class DailyTemperature(ResponseModel):
     """Daily temperature data."""
 
     day: float = Field(..., description="Day temperature")
@@ -218,7 +251,7 @@ class DailyTemperature(BaseModel):
     morn: float = Field(..., description="Morning temperature")
 
 
-class DailyFeelsLike(BaseModel):
+class DailyFeelsLike(ResponseModel):
     """Daily feels like temperature data."""
 
     day: float = Field(..., description="Day feels like temperature")
@@ -227,7 +260,7 @@ class DailyFeelsLike(BaseModel):
     morn: float = Field(..., description="Morning feels like temperature")
 
 
-class DailyForecast(BaseModel):
+class DailyForecast(ResponseModel):
     """Daily forecast data."""
 
     dt: int = Field(..., description="Time (Unix, UTC)")
@@ -252,7 +285,7 @@ class DailyForecast(BaseModel):
     uvi: float = Field(..., description="UV index")
 
 
-class WeatherAlert(BaseModel):
+class WeatherAlert(ResponseModel):
     """Weather alert data."""
 
     sender_name: str = Field(..., description="Alert source name")
@@ -263,21 +296,21 @@ class WeatherAlert(BaseModel):
     tags: list[str] | None = Field(None, description="Alert tags")
 
 
-class OneCallResponse(BaseModel):
+class OneCallResponse(ResponseModel):
     """Response model for One Call API endpoint."""
 
     lat: float = Field(..., description="Latitude")
     lon: float = Field(..., description="Longitude")
     timezone: str = Field(..., description="Timezone name")
     timezone_offset: int = Field(..., description="Timezone offset from UTC in seconds")
-    current: dict[str, Any] | None = Field(None, description="Current weather data")
+    current: CurrentConditions | None = Field(None, description="Current weather data")
     minutely: list[MinutelyForecast] | None = Field(None, description="Minutely forecast data")
     hourly: list[HourlyForecast] | None = Field(None, description="Hourly forecast data")
     daily: list[DailyForecast] | None = Field(None, description="Daily forecast data")
     alerts: list[WeatherAlert] | None = Field(None, description="Weather alerts")
 
 
-class SolarRadiationData(BaseModel):
+class SolarRadiationData(ResponseModel):
     """Solar radiation data."""
 
     location: str = Field(..., description="Location name")
@@ -292,7 +325,7 @@ class SolarRadiationData(BaseModel):
     uv_index_avg: float | None = Field(None, description="Average UV index")
 
 
-class GeocodingResult(BaseModel):
+class GeocodingResult(ResponseModel):
     """Geocoding result for location search."""
 
     name: str = Field(..., description="Location name")
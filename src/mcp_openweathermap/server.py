@@ -3,19 +3,47 @@ OpenWeatherMap MCP Server
 Provides intent-based tools for accessing weather data, forecasts, and air quality.
 """
 
-from datetime import datetime
+import asyncio
+import calendar
+import datetime
+import hashlib
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from importlib.resources import files
+from importlib.util import find_spec
 from typing import Any
 
+import anyio
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.middleware import Middleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from fastmcp import FastMCP
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
 from .api_client import OpenWeatherMapAPIError, OpenWeatherMapClient
+from .api_models import GeocodingResult
+
+# Singleton client instance, shared by all tool calls for the life of the process
+_client: OpenWeatherMapClient | None = None
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP[None]) -> AsyncIterator[None]:
+    """Open the shared API client's session at startup and close it on shutdown.
+
+    Opening it up front means the first tool call doesn't pay for session setup.
+    """
+    async with get_client():
+        yield
+
 
 # Initialize FastMCP server
 mcp = FastMCP(
     "OpenWeatherMap MCP Server",
+    lifespan=lifespan,
     instructions=(
         "Before using OpenWeatherMap tools, read the skill://openweathermap/usage resource "
         "for location resolution patterns and tool selection."
@@ -32,10 +60,6 @@ def openweathermap_skill() -> str:
     return SKILL_CONTENT
 
 
-# Singleton client instance
-_client: OpenWeatherMapClient | None = None
-
-
 def get_client() -> OpenWeatherMapClient:
     """Get or create the singleton API client."""
     global _client
@@ -74,11 +98,40 @@ async def resolve_coordinates(
         raise
 
 
+# search_location projects geocoding results to these fields in pydantic-core
+_LOCATIONS = TypeAdapter(list[GeocodingResult])
+_LOCATION_FIELDS = {"__all__": {"name", "state", "country", "lat", "lon"}}
+
+# Month and day may drop their leading zero ("2024-1-5"), as strptime's %m/%d allow
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+
+def parse_date(value: str) -> int:
+    """Convert a YYYY-MM-DD date to the Unix timestamp of its midnight (UTC).
+
+    Raises ValueError if the string is not a valid calendar date in that format.
+    """
+    match = _DATE_RE.fullmatch(value)
+    if match is None:
+        raise ValueError(f"{value!r} does not match YYYY-MM-DD")
+    day = datetime.date(int(match[1]), int(match[2]), int(match[3]))
+    return calendar.timegm(day.timetuple())
+
+
+# The health payload never changes, so it is serialized once at import. Probes
+# that send the ETag back in If-None-Match get an empty 304 instead.
+_HEALTH_BODY = to_json({"status": "healthy", "service": "mcp-openweathermap"})
+_HEALTH_ETAG = f'"{hashlib.md5(_HEALTH_BODY, usedforsecurity=False).hexdigest()}"'
+_HEALTH_HEADERS = {"ETag": _HEALTH_ETAG}
+
+
 # Health endpoint for HTTP transport
 @mcp.custom_route("/health", methods=["GET"])
-async def health_check(request: Request) -> JSONResponse:
+async def health_check(request: Request) -> Response:
     """Health check endpoint for container monitoring."""
-    return JSONResponse({"status": "healthy", "service": "mcp-openweathermap"})
+    if request.headers.get("if-none-match") == _HEALTH_ETAG:
+        return Response(status_code=304, headers=_HEALTH_HEADERS)
+    return Response(_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS)
 
 
 @mcp.tool()
@@ -98,18 +151,8 @@ async def search_location(query: str, limit: int = 5) -> list[dict[str, Any]]:
         List of matching locations with name, state, country, lat, lon
     """
     client = get_client()
-    async with client:
-        results = await client.geocode_location(query, limit=limit)
-        return [
-            {
-                "name": r.name,
-                "state": r.state,
-                "country": r.country,
-                "lat": r.lat,
-                "lon": r.lon,
-            }
-            for r in results
-        ]
+    results = await client.geocode_location(query, limit=limit)
+    return _LOCATIONS.dump_python(results, include=_LOCATION_FIELDS)
 
 
 @mcp.tool()
@@ -134,10 +177,8 @@ async def check_weather(
         Current temperature, humidity, wind, weather conditions
     """
     client = get_client()
-    async with client:
-        resolved_lat, resolved_lon = await resolve_coordinates(client, location, lat, lon)
-        weather = await client.get_current_weather(resolved_lat, resolved_lon, units)
-        return weather.model_dump()
+    resolved_lat, resolved_lon = await resolve_coordinates(client, location, lat, lon)
+    return await client.get_current_weather_raw(resolved_lat, resolved_lon, units)
 
 
 @mcp.tool()
@@ -162,9 +203,8 @@ async def get_forecast(
         Forecast data with 'source' field ('one_call' or 'free_tier')
     """
     client = get_client()
-    async with client:
-        resolved_lat, resolved_lon = await resolve_coordinates(client, location, lat, lon)
-        return await client.get_forecast_with_fallback(resolved_lat, resolved_lon, units)
+    resolved_lat, resolved_lon = await resolve_coordinates(client, location, lat, lon)
+    return await client.get_forecast_with_fallback(resolved_lat, resolved_lon, units)
 
 
 @mcp.tool()
@@ -187,10 +227,8 @@ async def check_air_quality(
         AQI (1=Good to 5=Very Poor) and pollutant concentrations
     """
     client = get_client()
-    async with client:
-        resolved_lat, resolved_lon = await resolve_coordinates(client, location, lat, lon)
-        data = await client.get_air_quality(resolved_lat, resolved_lon)
-        return data.model_dump()
+    resolved_lat, resolved_lon = await resolve_coordinates(client, location, lat, lon)
+    return await client.get_air_quality_raw(resolved_lat, resolved_lon)
 
 
 @mcp.tool()
@@ -217,29 +255,77 @@ async def get_historical_weather(
         Historical weather data or subscription error
     """
     client = get_client()
-    async with client:
-        resolved_lat, resolved_lon = await resolve_coordinates(client, location, lat, lon)
+    resolved_lat, resolved_lon = await resolve_coordinates(client, location, lat, lon)
+
+    try:
+        dt = parse_date(date)
+    except ValueError as e:
+        return {"error": f"Invalid date format. Use YYYY-MM-DD. {e}"}
+
+    try:
+        data = await client.get_one_call_timemachine_raw(resolved_lat, resolved_lon, dt, units)
+        return {"source": "one_call", **data}
+    except OpenWeatherMapAPIError as e:
+        if e.status in (401, 403):
+            return {
+                "error": "Historical weather requires One Call API subscription",
+                "subscription_url": "https://openweathermap.org/api/one-call-3",
+            }
+        raise
 
-        try:
-            dt = int(datetime.strptime(date, "%Y-%m-%d").timestamp())
-        except ValueError as e:
-            return {"error": f"Invalid date format. Use YYYY-MM-DD. {e}"}
 
-        try:
-            data = await client.get_one_call_timemachine(resolved_lat, resolved_lon, dt, units)
-            return {"source": "one_call", **data.model_dump()}
-        except OpenWeatherMapAPIError as e:
-            if e.status in (401, 403):
-                return {
-                    "error": "Historical weather requires One Call API subscription",
-                    "subscription_url": "https://openweathermap.org/api/one-call-3",
-                }
-            raise
+@mcp.tool()
+async def check_location_summary(
+    location: str | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+    units: str = "metric",
+) -> dict[str, Any]:
+    """Get current weather, forecast, and air quality for one location in a single call.
 
+    Use instead of calling check_weather, get_forecast, and check_air_quality
+    separately: the location is resolved once and the three lookups run concurrently.
+    Pass location string OR lat/lon coordinates.
+    If location lookup fails, use search_location to resolve first.
 
-# Create ASGI application for uvicorn
-app = mcp.http_app()
+    Args:
+        location: City name (e.g., 'London', 'Tokyo')
+        lat: Latitude (use with lon instead of location)
+        lon: Longitude (use with lat instead of location)
+        units: 'metric' (Celsius), 'imperial' (Fahrenheit), 'standard' (Kelvin)
+
+    Returns:
+        'weather', 'forecast', and 'air_quality', each as returned by the matching tool
+    """
+    client = get_client()
+    resolved_lat, resolved_lon = await resolve_coordinates(client, location, lat, lon)
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            weather = tg.create_task(
+                client.get_current_weather_raw(resolved_lat, resolved_lon, units)
+            )
+            forecast = tg.create_task(
+                client.get_forecast_with_fallback(resolved_lat, resolved_lon, units)
+            )
+            air_quality = tg.create_task(client.get_air_quality_raw(resolved_lat, resolved_lon))
+    except* OpenWeatherMapAPIError as group:
+        # Surface the API error itself, as the single-lookup tools do
+        raise group.exceptions[0] from None
+
+    return {
+        "weather": weather.result(),
+        "forecast": forecast.result(),
+        "air_quality": air_quality.result(),
+    }
+
+
+# Create ASGI application for uvicorn. Forecast results run to tens of KB of JSON,
+# so compress larger responses; Starlette leaves SSE streams uncompressed.
+app = mcp.http_app(middleware=[Middleware(GZipMiddleware, minimum_size=1024)])
 
 
 if __name__ == "__main__":
-    mcp.run()
+    # uvloop comes with uvicorn[standard] on Linux/macOS (the HTTP image also runs
+    # uvicorn with --loop uvloop); fall back to the stock asyncio loop elsewhere
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": find_spec("uvloop") is not None})
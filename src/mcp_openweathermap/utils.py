@@ -17,6 +17,93 @@ PANAMA_LOCATIONS: dict[str, dict[str, float]] = {
     "Penonomé": {"lat": 8.5167, "lon": -80.3500},
 }
 
+# Lowercased names, built once so lookups don't re-lowercase every preset per call
+_PANAMA_LOCATIONS_LOWER = {name.lower(): coords for name, coords in PANAMA_LOCATIONS.items()}
+
+# Seasonal adjustment by month (index 0 = January). Northern hemisphere: June (6) is
+# peak, December (12) is minimum. Southern hemisphere: opposite
+_SEASONAL_FACTORS_NORTH = tuple(1 + 0.3 * math.cos((m - 6) * math.pi / 6) for m in range(1, 13))
+_SEASONAL_FACTORS_SOUTH = tuple(1 + 0.3 * math.cos((m - 12) * math.pi / 6) for m in range(1, 13))
+
+# Base solar radiation (kWh/m²/day) by latitude zone, as (upper bound of |lat|, radiation)
+_LATITUDE_ZONES = (
+    (10.0, 5.8),  # Equatorial zone
+    (23.5, 5.5),  # Tropical zone
+    (35.0, 4.5),  # Subtropical zone
+)
+_TEMPERATE_RADIATION = 3.5
+
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+
+
+def _base_radiation(abs_lat: float) -> float:
+    """Return the base solar radiation for an absolute latitude."""
+    for upper_bound, radiation in _LATITUDE_ZONES:
+        if abs_lat < upper_bound:
+            return radiation
+    return _TEMPERATE_RADIATION
+
+
+def _seasonal_factor(seasonal_factors: tuple[float, ...], month: int) -> float:
+    """Return a hemisphere's seasonal factor for a month, rejecting months outside 1-12."""
+    if not 1 <= month <= 12:
+        raise ValueError(f"month must be between 1 and 12, got {month}")
+    return seasonal_factors[month - 1]
+
+
+def _cloud_factor(cloud_cover: float) -> float:
+    """Return the radiation reduction factor for a cloud cover percentage (0-100)."""
+    return 1 - (cloud_cover / 100) * 0.75  # Clouds reduce by up to 75%
+
+
+def _radiation_estimate(
+    base_radiation: float, cloud_factor: float, uv_index: float | None
+) -> dict[str, float]:
+    """Apply the cloud and UV factors to a (seasonally adjusted) base radiation."""
+    # UV index adjustment (if available)
+    uv_factor = 1.0
+    if uv_index is not None:
+        # UV index correlates with solar radiation
+        # UV 0-2: Low, 3-5: Moderate, 6-7: High, 8-10: Very High, 11+: Extreme
+        # Adjust radiation based on UV index
+        uv_factor = min(1.5, 0.7 + (uv_index * 0.08))  # Scale from 0.7 to 1.5
+
+    # Calculate adjusted radiation
+    avg_daily_kwh_m2 = base_radiation * cloud_factor * uv_factor
+
+    # Peak sun hours is approximately equal to kWh/m²/day
+    peak_sun_hours = avg_daily_kwh_m2
+
+    return {
+        "avg_daily_kwh_m2": round(avg_daily_kwh_m2, 2),
+        "peak_sun_hours": round(peak_sun_hours, 2),
+        "cloud_cover_factor": round(cloud_factor, 3),
+        "uv_factor": round(uv_factor, 3),
+    }
+
+
+def _monthly_averages(
+    base_radiation: float, seasonal_factors: tuple[float, ...], cloud_factor: float
+) -> dict[str, float]:
+    """Return the January-December averages for a base radiation and cloud factor."""
+    return {
+        month_name: round(base_radiation * seasonal_factor * cloud_factor, 2)
+        for month_name, seasonal_factor in zip(_MONTH_NAMES, seasonal_factors, strict=True)
+    }
+
 
 def parse_location_name(location: str) -> dict[str, float] | None:
     """Parse a location name and return coordinates if it's a known Panama location.
@@ -28,18 +115,19 @@ def parse_location_name(location: str) -> dict[str, float] | None:
         Dictionary with lat/lon if found, None otherwise
     """
     # Check exact match first
-    if location in PANAMA_LOCATIONS:
-        return PANAMA_LOCATIONS[location]
+    coords = PANAMA_LOCATIONS.get(location)
+    if coords is not None:
+        return coords
 
     # Check case-insensitive match
     location_lower = location.lower()
-    for name, coords in PANAMA_LOCATIONS.items():
-        if name.lower() == location_lower:
-            return coords
+    coords = _PANAMA_LOCATIONS_LOWER.get(location_lower)
+    if coords is not None:
+        return coords
 
     # Check partial match
-    for name, coords in PANAMA_LOCATIONS.items():
-        if location_lower in name.lower() or name.lower() in location_lower:
+    for name_lower, coords in _PANAMA_LOCATIONS_LOWER.items():
+        if location_lower in name_lower or name_lower in location_lower:
             return coords
 
     return None
@@ -67,54 +155,20 @@ def calculate_solar_radiation_from_weather(
 
     Returns:
         Dictionary with solar radiation estimates
+
+    Raises:
+        ValueError: If month is given but not between 1 and 12
     """
     # Base solar radiation at given latitude (kWh/m²/day)
     # Tropical latitudes (0-23.5°) have high solar radiation year-round
-    abs_lat = abs(lat)
-
-    # Base radiation by latitude zone
-    if abs_lat < 10:
-        base_radiation = 5.8  # Equatorial zone
-    elif abs_lat < 23.5:
-        base_radiation = 5.5  # Tropical zone
-    elif abs_lat < 35:
-        base_radiation = 4.5  # Subtropical zone
-    else:
-        base_radiation = 3.5  # Temperate zone
+    base_radiation = _base_radiation(abs(lat))
 
     # Seasonal adjustment if month is provided
     if month is not None:
-        # Northern hemisphere: June (6) is peak, December (12) is minimum
-        # Southern hemisphere: opposite
-        if lat >= 0:  # Northern hemisphere
-            seasonal_factor = 1 + 0.3 * math.cos((month - 6) * math.pi / 6)
-        else:  # Southern hemisphere
-            seasonal_factor = 1 + 0.3 * math.cos((month - 12) * math.pi / 6)
-        base_radiation *= seasonal_factor
-
-    # Cloud cover reduction factor (0-100% clouds)
-    cloud_factor = 1 - (cloud_cover / 100) * 0.75  # Clouds reduce by up to 75%
-
-    # UV index adjustment (if available)
-    uv_factor = 1.0
-    if uv_index is not None:
-        # UV index correlates with solar radiation
-        # UV 0-2: Low, 3-5: Moderate, 6-7: High, 8-10: Very High, 11+: Extreme
-        # Adjust radiation based on UV index
-        uv_factor = min(1.5, 0.7 + (uv_index * 0.08))  # Scale from 0.7 to 1.5
+        seasonal_factors = _SEASONAL_FACTORS_NORTH if lat >= 0 else _SEASONAL_FACTORS_SOUTH
+        base_radiation *= _seasonal_factor(seasonal_factors, month)
 
-    # Calculate adjusted radiation
-    avg_daily_kwh_m2 = base_radiation * cloud_factor * uv_factor
-
-    # Peak sun hours is approximately equal to kWh/m²/day
-    peak_sun_hours = avg_daily_kwh_m2
-
-    return {
-        "avg_daily_kwh_m2": round(avg_daily_kwh_m2, 2),
-        "peak_sun_hours": round(peak_sun_hours, 2),
-        "cloud_cover_factor": round(cloud_factor, 3),
-        "uv_factor": round(uv_factor, 3),
-    }
+    return _radiation_estimate(base_radiation, _cloud_factor(cloud_cover), uv_index)
 
 
 def calculate_monthly_solar_averages(
@@ -129,29 +183,12 @@ def calculate_monthly_solar_averages(
     Returns:
         Dictionary with monthly averages (January through December)
     """
-    months = [
-        "january",
-        "february",
-        "march",
-        "april",
-        "may",
-        "june",
-        "july",
-        "august",
-        "september",
-        "october",
-        "november",
-        "december",
-    ]
-
-    monthly_data = {}
-    for month_num, month_name in enumerate(months, start=1):
-        radiation_data = calculate_solar_radiation_from_weather(
-            lat=lat, cloud_cover=annual_avg_cloud_cover, month=month_num
-        )
-        monthly_data[month_name] = radiation_data["avg_daily_kwh_m2"]
-
-    return monthly_data
+    # Same model as calculate_solar_radiation_from_weather (without UV), with the
+    # month-independent terms computed once instead of per month
+    seasonal_factors = _SEASONAL_FACTORS_NORTH if lat >= 0 else _SEASONAL_FACTORS_SOUTH
+    return _monthly_averages(
+        _base_radiation(abs(lat)), seasonal_factors, _cloud_factor(annual_avg_cloud_cover)
+    )
 
 
 def create_solar_radiation_response(
@@ -174,14 +211,24 @@ def create_solar_radiation_response(
 
     Returns:
         SolarRadiationData object
+
+    Raises:
+        ValueError: If month is given but not between 1 and 12
     """
+    # The current estimate and the monthly averages share the latitude, season
+    # and cloud terms, so compute them once for both
+    base_radiation = _base_radiation(abs(lat))
+    seasonal_factors = _SEASONAL_FACTORS_NORTH if lat >= 0 else _SEASONAL_FACTORS_SOUTH
+    cloud_factor = _cloud_factor(cloud_cover)
+
     # Calculate current solar radiation
-    radiation_data = calculate_solar_radiation_from_weather(
-        lat=lat, cloud_cover=cloud_cover, uv_index=uv_index, month=month
-    )
+    current_radiation = base_radiation
+    if month is not None:
+        current_radiation *= _seasonal_factor(seasonal_factors, month)
+    radiation_data = _radiation_estimate(current_radiation, cloud_factor, uv_index)
 
     # Calculate monthly averages
-    monthly_averages = calculate_monthly_solar_averages(lat=lat, annual_avg_cloud_cover=cloud_cover)
+    monthly_averages = _monthly_averages(base_radiation, seasonal_factors, cloud_factor)
 
     return SolarRadiationData(
         location=location,
@@ -1,10 +1,18 @@
 """Tests for OpenWeatherMap API client."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import gc
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from aiohttp import ClientError
+from pydantic import ValidationError
 
+from mcp_openweathermap import api_client
 from mcp_openweathermap.api_client import OpenWeatherMapAPIError, OpenWeatherMapClient
+from mcp_openweathermap.api_models import GeocodingResult
 
 
 @pytest.fixture
@@ -13,6 +21,52 @@ def client() -> OpenWeatherMapClient:
     return OpenWeatherMapClient(api_key="test_api_key")
 
 
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response used as an async context manager."""
+
+    def __init__(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.status = status
+        self.headers = {"Content-Type": content_type}
+        self._body = body
+
+    async def read(self) -> bytes:
+        await asyncio.sleep(0)  # Yield like a real network read would
+        return self._body
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class FakeSession:
+    """Records requests and replies with a canned response."""
+
+    def __init__(self, response: FakeResponse) -> None:
+        self.response = response
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    def request(self, method: str, url: str, params: dict[str, Any], **kwargs: Any) -> FakeResponse:
+        self.calls.append((method, url, dict(params)))
+        return self.response
+
+    async def close(self) -> None:
+        return None
+
+
+def install_response(
+    client: OpenWeatherMapClient,
+    status: int,
+    body: bytes,
+    content_type: str = "application/json",
+) -> FakeSession:
+    """Attach a FakeSession replying with a canned response to the client."""
+    session = FakeSession(FakeResponse(status, body, content_type))
+    client._session = session  # type: ignore[assignment]
+    return session
+
+
 class TestResolveLocation:
     """Tests for location resolution."""
 
@@ -32,12 +86,10 @@ class TestResolveLocation:
         self, client: OpenWeatherMapClient
     ) -> None:
         """Test that invalid coordinate-like strings fall back to geocoding."""
-        mock_result = MagicMock()
-        mock_result.lat = 51.5074
-        mock_result.lon = -0.1278
+        result = GeocodingResult(name="London", lat=51.5074, lon=-0.1278, country="GB")
 
         with patch.object(
-            client, "geocode_location", new_callable=AsyncMock, return_value=[mock_result]
+            client, "geocode_location", new_callable=AsyncMock, return_value=[result]
         ):
             lat, lon = await client.resolve_location("London, UK")
             assert lat == 51.5074
@@ -47,12 +99,10 @@ class TestResolveLocation:
         self, client: OpenWeatherMapClient
     ) -> None:
         """Test that out-of-range coordinates fall back to geocoding."""
-        mock_result = MagicMock()
-        mock_result.lat = 0.0
-        mock_result.lon = 0.0
+        result = GeocodingResult(name="Null Island", lat=0.0, lon=0.0, country="XX")
 
         with patch.object(
-            client, "geocode_location", new_callable=AsyncMock, return_value=[mock_result]
+            client, "geocode_location", new_callable=AsyncMock, return_value=[result]
         ):
             # Latitude > 90 is invalid
             lat, lon = await client.resolve_location("100.0,50.0")
@@ -73,77 +123,187 @@ class TestResolveLocation:
 class TestGetForecastWithFallback:
     """Tests for graceful degradation in forecast retrieval."""
 
+    FREE_TIER_FORECAST: dict[str, Any] = {"list": [], "city": {"name": "London"}}
+
     async def test_one_call_success(self, client: OpenWeatherMapClient) -> None:
         """Test successful One Call API response."""
-        mock_one_call = MagicMock()
-        mock_one_call.current = {"temp": 20}
-        mock_one_call.hourly = []
-        mock_one_call.daily = []
-        mock_one_call.alerts = None
-        mock_one_call.timezone = "Europe/London"
+        one_call = {"current": {"temp": 20}, "hourly": [], "timezone": "Europe/London"}
 
-        with patch.object(
-            client, "get_one_call", new_callable=AsyncMock, return_value=mock_one_call
+        with (
+            patch.object(client, "get_one_call_raw", new_callable=AsyncMock, return_value=one_call),
+            patch.object(client, "get_forecast_raw", new_callable=AsyncMock),
         ):
             result = await client.get_forecast_with_fallback(51.5, -0.1)
 
             assert result["source"] == "one_call"
             assert result["timezone"] == "Europe/London"
+            assert result["current"] == {"temp": 20}
             assert result["alerts"] == []
+            client.get_one_call_raw.assert_awaited_once_with(51.5, -0.1, "metric")
+
+    async def test_free_tier_not_requested_once_subscribed(
+        self, client: OpenWeatherMapClient
+    ) -> None:
+        """Test the speculative free-tier request stops once One Call is known to work."""
+        with (
+            patch.object(client, "get_one_call_raw", new_callable=AsyncMock, return_value={}),
+            patch.object(client, "get_forecast_raw", new_callable=AsyncMock) as mock_free,
+        ):
+            await client.get_forecast_with_fallback(51.5, -0.1)
+            mock_free.reset_mock()
+            await client.get_forecast_with_fallback(51.5, -0.1)
+
+            mock_free.assert_not_called()
+
+    async def test_fallback_runs_concurrently(self, client: OpenWeatherMapClient) -> None:
+        """Test an unknown tier fetches both tiers at once instead of in sequence."""
+        started: list[str] = []
+
+        async def one_call(*args: Any) -> dict[str, Any]:
+            started.append("one_call")
+            await asyncio.sleep(0)
+            assert "free_tier" in started
+            raise OpenWeatherMapAPIError(401, "Unauthorized")
+
+        async def free_tier(*args: Any) -> dict[str, Any]:
+            started.append("free_tier")
+            return self.FREE_TIER_FORECAST
+
+        with (
+            patch.object(client, "get_one_call_raw", side_effect=one_call),
+            patch.object(client, "get_forecast_raw", side_effect=free_tier),
+        ):
+            result = await client.get_forecast_with_fallback(51.5, -0.1)
+
+        assert result["source"] == "free_tier"
+
+    async def test_discarded_free_tier_response_is_cached(
+        self, client: OpenWeatherMapClient
+    ) -> None:
+        """Test the speculative request dropped after a One Call success still fills the cache."""
+        session = install_response(client, 200, b'{"list": [], "city": {"name": "London"}}')
+
+        async def one_call(*args: Any) -> dict[str, Any]:
+            # Let the speculative free-tier request get on the wire first
+            while not client._inflight:
+                await asyncio.sleep(0)
+            return {}
+
+        with patch.object(client, "get_one_call_raw", side_effect=one_call):
+            result = await client.get_forecast_with_fallback(51.5, -0.1)
+        assert result["source"] == "one_call"
+
+        while client._inflight:
+            await asyncio.sleep(0)
+        forecast = await client.get_forecast_raw(51.5, -0.1)
+
+        assert forecast["city"] == {"name": "London"}
+        assert len(session.calls) == 1
+
+    async def test_discarded_free_tier_failure_is_not_logged(
+        self, client: OpenWeatherMapClient
+    ) -> None:
+        """Test a speculative request failing after it was dropped isn't logged."""
+        install_response(client, 500, b'{"message": "boom"}')
+        loop = asyncio.get_running_loop()
+        unhandled: list[dict[str, Any]] = []
+
+        async def one_call(*args: Any) -> dict[str, Any]:
+            while not client._inflight:
+                await asyncio.sleep(0)
+            return {}
+
+        loop.set_exception_handler(lambda _, context: unhandled.append(context))
+        try:
+            with patch.object(client, "get_one_call_raw", side_effect=one_call):
+                await client.get_forecast_with_fallback(51.5, -0.1)
+            while client._inflight:
+                await asyncio.sleep(0)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+        assert unhandled == []
 
     async def test_fallback_on_401(self, client: OpenWeatherMapClient) -> None:
         """Test fallback to free tier on 401 unauthorized."""
-        mock_forecast = MagicMock()
-        mock_forecast.forecast_list = []
-        mock_forecast.city = MagicMock()
-        mock_forecast.city.model_dump.return_value = {"name": "London"}
-
         with (
             patch.object(
                 client,
-                "get_one_call",
+                "get_one_call_raw",
                 new_callable=AsyncMock,
                 side_effect=OpenWeatherMapAPIError(401, "Unauthorized"),
             ),
             patch.object(
-                client, "get_forecast", new_callable=AsyncMock, return_value=mock_forecast
+                client,
+                "get_forecast_raw",
+                new_callable=AsyncMock,
+                return_value=self.FREE_TIER_FORECAST,
             ),
         ):
             result = await client.get_forecast_with_fallback(51.5, -0.1)
 
             assert result["source"] == "free_tier"
+            assert result["city"] == {"name": "London"}
             assert "note" in result
             assert "One Call API subscription" in result["note"]
 
     async def test_fallback_on_403(self, client: OpenWeatherMapClient) -> None:
         """Test fallback to free tier on 403 forbidden."""
-        mock_forecast = MagicMock()
-        mock_forecast.forecast_list = []
-        mock_forecast.city = MagicMock()
-        mock_forecast.city.model_dump.return_value = {"name": "London"}
-
         with (
             patch.object(
                 client,
-                "get_one_call",
+                "get_one_call_raw",
                 new_callable=AsyncMock,
                 side_effect=OpenWeatherMapAPIError(403, "Forbidden"),
             ),
             patch.object(
-                client, "get_forecast", new_callable=AsyncMock, return_value=mock_forecast
+                client,
+                "get_forecast_raw",
+                new_callable=AsyncMock,
+                return_value=self.FREE_TIER_FORECAST,
+            ),
+        ):
+            result = await client.get_forecast_with_fallback(51.5, -0.1)
+
+            assert result["source"] == "free_tier"
+
+    async def test_unsubscribed_tier_is_remembered(self, client: OpenWeatherMapClient) -> None:
+        """Test One Call isn't retried after a 401 until the recheck interval passes."""
+        with (
+            patch.object(
+                client,
+                "get_one_call_raw",
+                new_callable=AsyncMock,
+                side_effect=OpenWeatherMapAPIError(401, "Unauthorized"),
+            ),
+            patch.object(
+                client,
+                "get_forecast_raw",
+                new_callable=AsyncMock,
+                return_value=self.FREE_TIER_FORECAST,
             ),
         ):
+            await client.get_forecast_with_fallback(51.5, -0.1)
             result = await client.get_forecast_with_fallback(51.5, -0.1)
 
             assert result["source"] == "free_tier"
+            client.get_one_call_raw.assert_called_once()
+            assert client.get_forecast_raw.call_count == 2
+
+            client._one_call_checked_at -= api_client.ONE_CALL_RECHECK_SECONDS
+            await client.get_forecast_with_fallback(51.5, -0.1)
+            assert client.get_one_call_raw.call_count == 2
 
     async def test_other_errors_propagate(self, client: OpenWeatherMapClient) -> None:
         """Test that non-auth errors are not caught."""
-        with patch.object(
-            client,
-            "get_one_call",
-            new_callable=AsyncMock,
-            side_effect=OpenWeatherMapAPIError(500, "Server Error"),
+        with (
+            patch.object(
+                client,
+                "get_one_call_raw",
+                new_callable=AsyncMock,
+                side_effect=OpenWeatherMapAPIError(500, "Server Error"),
+            ),
+            patch.object(client, "get_forecast_raw", new_callable=AsyncMock),
         ):
             with pytest.raises(OpenWeatherMapAPIError) as exc_info:
                 await client.get_forecast_with_fallback(51.5, -0.1)
@@ -155,22 +315,370 @@ class TestGetOneCallTimemachine:
 
     async def test_timemachine_request(self, client: OpenWeatherMapClient) -> None:
         """Test that timemachine endpoint is called correctly."""
-        mock_response = {
-            "lat": 51.5,
-            "lon": -0.1,
-            "timezone": "Europe/London",
-            "timezone_offset": 0,
-        }
+        mock_response = (
+            b'{"lat": 51.5, "lon": -0.1, "timezone": "Europe/London", "timezone_offset": 0}'
+        )
 
         with patch.object(
-            client, "_request", new_callable=AsyncMock, return_value=mock_response
+            client, "_request_bytes", new_callable=AsyncMock, return_value=mock_response
         ):
-            await client.get_one_call_timemachine(51.5, -0.1, 1704067200)
+            result = await client.get_one_call_timemachine(51.5, -0.1, 1704067200)
 
-            client._request.assert_called_once()
-            call_args = client._request.call_args
+            client._request_bytes.assert_called_once()
+            call_args = client._request_bytes.call_args
             assert "onecall/timemachine" in call_args[0][1]
             assert call_args[1]["params"]["dt"] == 1704067200
+            assert result.timezone == "Europe/London"
+
+
+class TestRequestBytes:
+    """Tests for the raw HTTP request path."""
+
+    async def test_returns_body_and_sends_api_key(self, client: OpenWeatherMapClient) -> None:
+        """Test successful responses are returned as raw bytes."""
+        session = install_response(client, 200, b'{"ok": true}')
+
+        body = await client._request_bytes("GET", "https://example.test/weather")
+
+        assert body == b'{"ok": true}'
+        assert session.calls[0][2] == {"appid": "test_api_key"}
+
+    async def test_endpoint_params_include_api_key(self, client: OpenWeatherMapClient) -> None:
+        """Test endpoint methods build params from the API key template."""
+        with patch.object(client, "_request_bytes", new_callable=AsyncMock, return_value=b"[]"):
+            await client.geocode_location("London", limit=1)
+
+            url = client._request_bytes.call_args[0][1]
+            params = client._request_bytes.call_args[1]["params"]
+        assert url == "https://api.openweathermap.org/geo/1.0/direct"
+        assert params == {"appid": "test_api_key", "q": "London", "limit": 1}
+        assert client._base_params == {"appid": "test_api_key"}
+
+    async def test_concurrent_identical_requests_are_coalesced(
+        self, client: OpenWeatherMapClient
+    ) -> None:
+        """Test identical in-flight requests share a single HTTP call."""
+        session = install_response(client, 200, b"{}")
+
+        url = "https://example.test/weather"
+        results = await asyncio.gather(
+            client._request_bytes("GET", url, {"lat": 1.0, "lon": 2.0}),
+            client._request_bytes("GET", url, {"lon": 2.0, "lat": 1.0}),
+            client._request_bytes("GET", url, {"lat": 3.0, "lon": 4.0}),
+        )
+
+        assert results == [b"{}", b"{}", b"{}"]
+        assert len(session.calls) == 2
+        assert client._inflight == {}
+
+    async def test_failed_request_without_waiters_is_not_logged(
+        self, client: OpenWeatherMapClient
+    ) -> None:
+        """Test a shared request that fails after its callers cancelled isn't logged."""
+        install_response(client, 500, b'{"message": "boom"}')
+        loop = asyncio.get_running_loop()
+        unhandled: list[dict[str, Any]] = []
+        loop.set_exception_handler(lambda _, context: unhandled.append(context))
+        try:
+            caller = asyncio.ensure_future(
+                client._request_bytes("GET", "https://example.test/weather")
+            )
+            await asyncio.sleep(0)
+            caller.cancel()
+            while client._inflight:
+                await asyncio.sleep(0)
+            del caller
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+        assert unhandled == []
+
+    async def test_successful_responses_are_cached(
+        self, client: OpenWeatherMapClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test repeat GETs within the TTL are served without another request."""
+        session = install_response(client, 200, b"{}")
+        url = "https://example.test/weather"
+
+        await client._request_bytes("GET", url, {"lat": 1.0})
+        await client._request_bytes("GET", url, {"lat": 1.0})
+        assert len(session.calls) == 1
+
+        monkeypatch.setattr(api_client, "RESPONSE_CACHE_TTL_SECONDS", 0.0)
+        client._response_cache.clear()
+        await client._request_bytes("GET", url, {"lat": 1.0})
+        await client._request_bytes("GET", url, {"lat": 1.0})
+        assert len(session.calls) == 3
+
+    async def test_cache_ttl_is_per_endpoint(self, client: OpenWeatherMapClient) -> None:
+        """Test current weather and historical responses use their own TTLs."""
+        install_response(client, 200, b"{}")
+        params = {"lat": 1.0, "lon": 2.0}
+
+        now = time.monotonic()
+        await client._request_bytes("GET", client._weather_url, params)
+        await client._request_bytes("GET", client._timemachine_url, params)
+        await client._request_bytes("GET", client._air_pollution_url, params)
+
+        expiry = {
+            key[1]: expires_at - now for key, (expires_at, _) in client._response_cache.items()
+        }
+        assert expiry[client._weather_url] == pytest.approx(
+            api_client.CURRENT_WEATHER_CACHE_TTL_SECONDS, abs=1
+        )
+        assert expiry[client._timemachine_url] == pytest.approx(
+            api_client.TIMEMACHINE_CACHE_TTL_SECONDS, abs=1
+        )
+        assert expiry[client._air_pollution_url] == pytest.approx(
+            api_client.RESPONSE_CACHE_TTL_SECONDS, abs=1
+        )
+
+    async def test_cache_is_bounded_by_bytes(
+        self, client: OpenWeatherMapClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test least recently used bodies are evicted once the byte budget is exceeded."""
+        monkeypatch.setattr(api_client, "RESPONSE_CACHE_MAX_BYTES", 20)
+        session = install_response(client, 200, b'{"temp": 1}')
+        url = "https://example.test/weather"
+
+        await client._request_bytes("GET", url, {"lat": 1.0})
+        await client._request_bytes("GET", url, {"lat": 2.0})
+        await client._request_bytes("GET", url, {"lat": 3.0})
+
+        assert [dict(key[2])["lat"] for key in client._response_cache] == [3.0]
+        assert client._response_cache_bytes == len(b'{"temp": 1}')
+
+        # A body bigger than the whole budget is returned but not kept
+        session.response = FakeResponse(200, b"x" * 21)
+        assert await client._request_bytes("GET", url, {"lat": 4.0}) == b"x" * 21
+        assert not client._response_cache
+        assert client._response_cache_bytes == 0
+
+    async def test_expired_entries_are_purged_on_insert(self, client: OpenWeatherMapClient) -> None:
+        """Test expired bodies are dropped when a new one is cached, not only when re-read."""
+        install_response(client, 200, b'{"temp": 1}')
+        client._cache_ttls[client._onecall_url] = 0.0
+        params = {"lat": 1.0, "lon": 2.0}
+
+        await client._request_bytes("GET", client._onecall_url, params)
+        await client._request_bytes("GET", client._timemachine_url, params)
+        await client._request_bytes("GET", client._weather_url, params)
+
+        assert [key[1] for key in client._response_cache] == [
+            client._timemachine_url,
+            client._weather_url,
+        ]
+        assert client._response_cache_bytes == 2 * len(b'{"temp": 1}')
+
+    async def test_error_responses_are_not_cached(self, client: OpenWeatherMapClient) -> None:
+        """Test failed requests are retried rather than served from the cache."""
+        session = install_response(client, 500, b'{"message": "Server Error"}')
+
+        for _ in range(2):
+            with pytest.raises(OpenWeatherMapAPIError):
+                await client._request_bytes("GET", "https://example.test/weather")
+        assert len(session.calls) == 2
+
+    async def test_error_body_message_is_extracted(self, client: OpenWeatherMapClient) -> None:
+        """Test error responses raise with the API-provided message."""
+        install_response(client, 401, b'{"cod": 401, "message": "Invalid API key"}')
+
+        with pytest.raises(OpenWeatherMapAPIError) as exc_info:
+            await client._request_bytes("GET", "https://example.test/weather")
+        assert exc_info.value.status == 401
+        assert exc_info.value.message == "Invalid API key"
+        assert exc_info.value.details == {"cod": 401, "message": "Invalid API key"}
+
+    async def test_non_json_error_body_is_kept_as_text(self, client: OpenWeatherMapClient) -> None:
+        """Test non-JSON error bodies surface as raw text in the error details."""
+        install_response(client, 502, b"Bad Gateway", content_type="text/html")
+
+        with pytest.raises(OpenWeatherMapAPIError) as exc_info:
+            await client._request_bytes("GET", "https://example.test/weather")
+        assert exc_info.value.status == 502
+        assert exc_info.value.details == {"result": "Bad Gateway"}
+
+    async def test_nested_error_message_is_extracted(self, client: OpenWeatherMapClient) -> None:
+        """Test messages nested under an "error" object are used."""
+        body = b'{"error": {"code": 429, "message": "Too many requests"}}'
+        install_response(client, 429, body)
+
+        with pytest.raises(OpenWeatherMapAPIError) as exc_info:
+            await client._request_bytes("GET", "https://example.test/weather")
+        assert exc_info.value.message == "Too many requests"
+
+    async def test_network_error_handling(self, client: OpenWeatherMapClient) -> None:
+        """Test connection failures surface as a 500 OpenWeatherMapAPIError."""
+
+        def refuse(*args: Any, **kwargs: Any) -> FakeResponse:
+            raise ClientError("Connection refused")
+
+        session = install_response(client, 200, b"{}")
+        session.request = refuse  # type: ignore[method-assign]
+
+        with pytest.raises(OpenWeatherMapAPIError) as exc_info:
+            await client._request_bytes("GET", "https://example.test/weather")
+        assert exc_info.value.status == 500
+        assert exc_info.value.message == "Network error: Connection refused"
+        assert isinstance(exc_info.value.__cause__, ClientError)
+
+
+class TestGetWeatherBulk:
+    """Tests for batched current weather lookups."""
+
+    async def test_results_keep_input_order(self, client: OpenWeatherMapClient) -> None:
+        """Test every coordinate is fetched and results line up with the input."""
+
+        async def fake_weather(lat: float, lon: float, units: str) -> tuple[float, float, str]:
+            await asyncio.sleep(0.01 if lat == 1.0 else 0)
+            return lat, lon, units
+
+        with patch.object(client, "get_current_weather", side_effect=fake_weather):
+            results = await client.get_weather_bulk([(1.0, 2.0), (3.0, 4.0)], units="imperial")
+
+        assert results == [(1.0, 2.0, "imperial"), (3.0, 4.0, "imperial")]
+
+    async def test_invalid_coordinates_rejected_up_front(
+        self, client: OpenWeatherMapClient
+    ) -> None:
+        """Test out-of-range pairs fail the whole batch before any request is made."""
+        with patch.object(client, "get_current_weather", new_callable=AsyncMock) as mock_weather:
+            with pytest.raises(OpenWeatherMapAPIError) as exc_info:
+                await client.get_weather_bulk([(51.5, -0.1), (95.0, 0.0)])
+
+        assert exc_info.value.status == 400
+        assert "(95.0, 0.0)" in exc_info.value.message
+        mock_weather.assert_not_called()
+
+
+class TestGeocodeLocation:
+    """Tests for geocoding."""
+
+    async def test_geocode_parses_results(self, client: OpenWeatherMapClient) -> None:
+        """Test geocoding results are validated from the raw response."""
+        body = b'[{"name": "Waimea", "lat": 20.02, "lon": -155.66, "country": "US"}]'
+        with patch.object(client, "_request_bytes", new_callable=AsyncMock, return_value=body):
+            results = await client.geocode_location("Waimea")
+
+        assert len(results) == 1
+        assert results[0].name == "Waimea"
+        assert results[0].lat == 20.02
+        assert results[0].state is None
+
+    async def test_geocode_results_are_cached(self, client: OpenWeatherMapClient) -> None:
+        """Test repeat lookups (case- and whitespace-insensitive) skip the network."""
+        body = b'[{"name": "London", "lat": 51.5, "lon": -0.1, "country": "GB"}]'
+        with patch.object(client, "_request_bytes", new_callable=AsyncMock, return_value=body):
+            first = await client.geocode_location("London")
+            second = await client.geocode_location(" london ")
+
+            client._request_bytes.assert_called_once()
+        assert first == second
+        with pytest.raises(ValidationError):
+            first[0].lat = 0.0  # type: ignore[misc]
+
+    async def test_geocode_cache_is_bounded(
+        self, client: OpenWeatherMapClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the least recently used entry is evicted at capacity."""
+        monkeypatch.setattr(api_client, "GEOCODE_CACHE_SIZE", 2)
+        with patch.object(client, "_request_bytes", new_callable=AsyncMock, return_value=b"[]"):
+            for name in ("a", "b", "c"):
+                await client.geocode_location(name)
+
+        assert list(client._geocode_cache) == [("b", 5), ("c", 5)]
+
+    async def test_geocode_cache_entries_expire(
+        self, client: OpenWeatherMapClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test entries older than the TTL are looked up again."""
+        monkeypatch.setattr(api_client, "GEOCODE_CACHE_TTL_SECONDS", 0.0)
+        with patch.object(client, "_request_bytes", new_callable=AsyncMock, return_value=b"[]"):
+            await client.geocode_location("London")
+            await client.geocode_location("London")
+
+            assert client._request_bytes.call_count == 2
+
+
+class TestTrustUpstream:
+    """Tests for the opt-in unvalidated construction of large payloads."""
+
+    FORECAST_BODY = (
+        b'{"cod": "200", "cnt": 1, "list": [{"dt": 1704067200,'
+        b' "main": {"temp": 10.5, "feels_like": 9.0, "temp_min": 9.5, "temp_max": 11.0,'
+        b' "pressure": 1012, "humidity": 80},'
+        b' "weather": [{"id": 500, "main": "Rain", "description": "light rain", "icon": "10d"}],'
+        b' "clouds": {"all": 90}, "wind": {"speed": 4.1}, "rain": {"3h": 0.5},'
+        b' "sys": {"pod": "d"}}],'
+        b' "city": {"id": 1, "name": "London", "coord": {"lat": 51.5, "lon": -0.1},'
+        b' "country": "GB", "timezone": 0, "sunrise": 1, "sunset": 2}}'
+    )
+
+    ONE_CALL_BODY = (
+        b'{"lat": 51.5, "lon": -0.1, "timezone": "Europe/London", "timezone_offset": 0,'
+        b' "current": {"dt": 1704067200, "sunrise": 1, "sunset": 2, "temp": 7.5,'
+        b' "feels_like": 5.0, "pressure": 1010, "humidity": 85, "dew_point": 5.1,'
+        b' "uvi": 0.2, "clouds": 75, "visibility": 10000, "wind_speed": 5.5,'
+        b' "wind_deg": 240,'
+        b' "weather": [{"id": 803, "main": "Clouds", "description": "cloudy", "icon": "04d"}]}}'
+    )
+
+    CURRENT_WEATHER_BODY = (
+        b'{"coord": {"lon": -0.1, "lat": 51.5},'
+        b' "weather": [{"id": 800, "main": "Clear", "description": "clear sky", "icon": "01d"}],'
+        b' "main": {"temp": 20.0, "feels_like": 19.0, "temp_min": 18.0, "temp_max": 21.0,'
+        b' "pressure": 1015, "humidity": 50},'
+        b' "wind": {"speed": 3.0, "deg": 180}, "clouds": {"all": 0}, "dt": 1704067200,'
+        b' "sys": {"country": "GB", "sunrise": 1, "sunset": 2}, "timezone": 0,'
+        b' "id": 1, "name": "London", "cod": 200}'
+    )
+
+    def test_flag_reads_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test OWM_TRUST_UPSTREAM=1 enables trusted mode."""
+        monkeypatch.setenv("OWM_TRUST_UPSTREAM", "1")
+        assert OpenWeatherMapClient(api_key="k").trust_upstream is True
+        monkeypatch.delenv("OWM_TRUST_UPSTREAM")
+        assert OpenWeatherMapClient(api_key="k").trust_upstream is False
+
+    @pytest.mark.parametrize(
+        ("method", "body"),
+        [
+            ("get_forecast", FORECAST_BODY),
+            ("get_one_call", ONE_CALL_BODY),
+            ("get_current_weather", CURRENT_WEATHER_BODY),
+        ],
+    )
+    async def test_trusted_matches_validated(self, method: str, body: bytes) -> None:
+        """Test trusted construction builds the same model tree as validation."""
+        results = []
+        for trust in (True, False):
+            client = OpenWeatherMapClient(api_key="k", trust_upstream=trust)
+            with patch.object(client, "_request_bytes", new_callable=AsyncMock, return_value=body):
+                results.append(await getattr(client, method)(51.5, -0.1))
+
+        assert type(results[0]) is type(results[1])
+        assert results[0].model_dump() == results[1].model_dump()
+
+    async def test_trusted_builds_nested_models(self) -> None:
+        """Test trusted mode builds typed nested models, including aliased fields."""
+        client = OpenWeatherMapClient(api_key="k", trust_upstream=True)
+        with patch.object(client, "_request_bytes", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = self.FORECAST_BODY
+            forecast = await client.get_forecast(51.5, -0.1)
+            mock_request.return_value = self.ONE_CALL_BODY
+            one_call = await client.get_one_call(51.5, -0.1)
+            mock_request.return_value = self.CURRENT_WEATHER_BODY
+            current = await client.get_current_weather(51.5, -0.1)
+
+        assert forecast.forecast_list[0].rain is not None
+        assert forecast.forecast_list[0].rain.three_hour == 0.5
+        assert forecast.forecast_list[0].sys is not None
+        assert forecast.forecast_list[0].sys.pod == "d"
+        assert forecast.city.coord.lat == 51.5
+        assert one_call.current is not None
+        assert one_call.current.temp == 7.5
+        assert one_call.current.weather[0].main == "Clouds"
+        assert current.main.temp == 20.0
 
 
 class TestErrorHandling:
@@ -187,11 +695,11 @@ class TestErrorHandling:
         assert "401" in str(error)
         assert "Invalid API key" in str(error)
 
-    async def test_client_without_api_key_uses_env(self) -> None:
+    async def test_client_without_api_key_uses_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test client reads API key from environment."""
-        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "env_key"}):
-            client = OpenWeatherMapClient()
-            assert client.api_key == "env_key"
+        monkeypatch.setenv("OPENWEATHERMAP_API_KEY", "env_key")
+        client = OpenWeatherMapClient()
+        assert client.api_key == "env_key"
 
 
 class TestClientLifecycle:
@@ -206,15 +714,42 @@ class TestClientLifecycle:
 
         assert client._session is None
 
-    async def test_ensure_session_creates_session(self, client: OpenWeatherMapClient) -> None:
-        """Test _ensure_session creates a session if none exists."""
+    async def test_create_session_creates_session(self, client: OpenWeatherMapClient) -> None:
+        """Test _create_session creates and stores a session."""
         assert client._session is None
-        await client._ensure_session()
-        assert client._session is not None
+        session = await client._create_session()
+        assert client._session is session
         await client.close()
 
+    async def test_session_is_reused_across_requests(self, client: OpenWeatherMapClient) -> None:
+        """Test back-to-back requests share one lazily created session."""
+        session = FakeSession(FakeResponse(200, b"{}"))
+
+        async def create_session() -> FakeSession:
+            client._session = session  # type: ignore[assignment]
+            return session
+
+        with patch.object(client, "_create_session", side_effect=create_session) as mock_create:
+            await client._request_bytes("GET", "https://example.test/weather")
+            await client._request_bytes("GET", "https://example.test/forecast")
+
+        mock_create.assert_called_once()
+        assert len(session.calls) == 2
+
+    async def test_session_uses_keepalive_connector(self, client: OpenWeatherMapClient) -> None:
+        """Test the session pools and keeps connections alive between requests."""
+        session = await client._create_session()
+        try:
+            connector = session.connector
+            assert connector is not None
+            assert connector.limit == 100
+            assert connector.limit_per_host == 20
+            assert connector._keepalive_timeout == 75
+        finally:
+            await client.close()
+
     async def test_close_is_idempotent(self, client: OpenWeatherMapClient) -> None:
         """Test closing multiple times doesn't error."""
-        await client._ensure_session()
+        await client._create_session()
         await client.close()
         await client.close()  # Should not raise
@@ -1,11 +1,19 @@
 """Tests for OpenWeatherMap MCP server tools."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from fastapi import Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.routing import Route
 
 from mcp_openweathermap import server
-from mcp_openweathermap.api_client import OpenWeatherMapAPIError
+from mcp_openweathermap.api_client import OpenWeatherMapAPIError, OpenWeatherMapClient
+from mcp_openweathermap.api_models import GeocodingResult
 
 
 @pytest.fixture(autouse=True)
@@ -15,11 +23,13 @@ def reset_client() -> None:
 
 
 @pytest.fixture
-def mock_client() -> MagicMock:
-    """Create a mock client."""
-    client = MagicMock()
-    client.__aenter__ = AsyncMock(return_value=client)
-    client.__aexit__ = AsyncMock(return_value=None)
+def mock_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Create a mock client limited to OpenWeatherMapClient's interface.
+
+    Tools requesting this fixture get it from server.get_client().
+    """
+    client = MagicMock(spec=OpenWeatherMapClient)
+    monkeypatch.setattr(server, "get_client", lambda: client)
     return client
 
 
@@ -29,6 +39,7 @@ check_weather_fn = server.check_weather.fn
 get_forecast_fn = server.get_forecast.fn
 check_air_quality_fn = server.check_air_quality.fn
 get_historical_weather_fn = server.get_historical_weather.fn
+check_location_summary_fn = server.check_location_summary.fn
 
 
 class TestSearchLocation:
@@ -36,48 +47,39 @@ class TestSearchLocation:
 
     async def test_search_returns_candidates(self, mock_client: MagicMock) -> None:
         """Test search_location returns matching locations."""
-        mock_result1 = MagicMock()
-        mock_result1.name = "Waimea"
-        mock_result1.state = "Hawaii"
-        mock_result1.country = "US"
-        mock_result1.lat = 20.02
-        mock_result1.lon = -155.66
-
-        mock_result2 = MagicMock()
-        mock_result2.name = "Waimea"
-        mock_result2.state = "Hawaii"
-        mock_result2.country = "US"
-        mock_result2.lat = 21.96
-        mock_result2.lon = -159.67
+        mock_result1 = GeocodingResult(
+            name="Waimea", state="Hawaii", country="US", lat=20.02, lon=-155.66
+        )
+        mock_result2 = GeocodingResult(
+            name="Waimea", state="Hawaii", country="US", lat=21.96, lon=-159.67
+        )
 
         mock_client.geocode_location = AsyncMock(return_value=[mock_result1, mock_result2])
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await search_location_fn("Waimea")
+        result = await search_location_fn("Waimea")
 
-            mock_client.geocode_location.assert_called_once_with("Waimea", limit=5)
-            assert len(result) == 2
-            assert result[0]["name"] == "Waimea"
-            assert result[0]["lat"] == 20.02
-            assert result[1]["lat"] == 21.96
+        mock_client.geocode_location.assert_called_once_with("Waimea", limit=5)
+        assert len(result) == 2
+        assert result[0]["name"] == "Waimea"
+        assert result[0]["lat"] == 20.02
+        assert result[1]["lat"] == 21.96
+        assert set(result[0]) == {"name", "state", "country", "lat", "lon"}
 
     async def test_search_with_custom_limit(self, mock_client: MagicMock) -> None:
         """Test search_location respects limit parameter."""
         mock_client.geocode_location = AsyncMock(return_value=[])
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            await search_location_fn("Springfield", limit=10)
+        await search_location_fn("Springfield", limit=10)
 
-            mock_client.geocode_location.assert_called_once_with("Springfield", limit=10)
+        mock_client.geocode_location.assert_called_once_with("Springfield", limit=10)
 
     async def test_search_returns_empty_for_no_matches(self, mock_client: MagicMock) -> None:
         """Test search_location returns empty list for no matches."""
         mock_client.geocode_location = AsyncMock(return_value=[])
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await search_location_fn("NonexistentPlace12345")
+        result = await search_location_fn("NonexistentPlace12345")
 
-            assert result == []
+        assert result == []
 
 
 class TestCheckWeather:
@@ -85,60 +87,33 @@ class TestCheckWeather:
 
     async def test_check_weather_by_city(self, mock_client: MagicMock) -> None:
         """Test getting weather for a city name."""
-        mock_weather = MagicMock()
-        mock_weather.model_dump.return_value = {
+        mock_weather = {
             "name": "London",
             "main": {"temp": 15.5, "humidity": 80},
             "weather": [{"description": "cloudy"}],
         }
 
         mock_client.resolve_location = AsyncMock(return_value=(51.5, -0.1))
-        mock_client.get_current_weather = AsyncMock(return_value=mock_weather)
+        mock_client.get_current_weather_raw = AsyncMock(return_value=mock_weather)
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await check_weather_fn(location="London")
+        result = await check_weather_fn(location="London")
 
-            mock_client.resolve_location.assert_called_once_with("London")
-            mock_client.get_current_weather.assert_called_once_with(51.5, -0.1, "metric")
-            assert result["name"] == "London"
-            assert result["main"]["temp"] == 15.5
+        mock_client.resolve_location.assert_called_once_with("London")
+        mock_client.get_current_weather_raw.assert_called_once_with(51.5, -0.1, "metric")
+        assert result["name"] == "London"
+        assert result["main"]["temp"] == 15.5
 
     async def test_check_weather_with_units(self, mock_client: MagicMock) -> None:
         """Test getting weather with imperial units."""
-        mock_weather = MagicMock()
-        mock_weather.model_dump.return_value = {"main": {"temp": 59.9}}
+        mock_weather = {"main": {"temp": 59.9}}
 
         mock_client.resolve_location = AsyncMock(return_value=(40.7, -74.0))
-        mock_client.get_current_weather = AsyncMock(return_value=mock_weather)
-
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await check_weather_fn(location="New York", units="imperial")
-
-            mock_client.get_current_weather.assert_called_once_with(40.7, -74.0, "imperial")
-            assert result["main"]["temp"] == 59.9
+        mock_client.get_current_weather_raw = AsyncMock(return_value=mock_weather)
 
-    async def test_check_weather_by_lat_lon(self, mock_client: MagicMock) -> None:
-        """Test getting weather using direct lat/lon coordinates."""
-        mock_weather = MagicMock()
-        mock_weather.model_dump.return_value = {"coord": {"lat": 35.6, "lon": 139.6}}
+        result = await check_weather_fn(location="New York", units="imperial")
 
-        mock_client.get_current_weather = AsyncMock(return_value=mock_weather)
-
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await check_weather_fn(lat=35.6762, lon=139.6503)
-
-            # Should NOT call resolve_location when lat/lon provided
-            mock_client.resolve_location = AsyncMock()
-            mock_client.get_current_weather.assert_called_once_with(35.6762, 139.6503, "metric")
-            assert result["coord"]["lat"] == 35.6
-
-    async def test_check_weather_missing_params_error(self, mock_client: MagicMock) -> None:
-        """Test error when neither location nor lat/lon provided."""
-        with patch.object(server, "get_client", return_value=mock_client):
-            with pytest.raises(OpenWeatherMapAPIError) as exc_info:
-                await check_weather_fn()
-            assert exc_info.value.status == 400
-            assert "Provide either" in exc_info.value.message
+        mock_client.get_current_weather_raw.assert_called_once_with(40.7, -74.0, "imperial")
+        assert result["main"]["temp"] == 59.9
 
 
 class TestGetForecast:
@@ -156,12 +131,11 @@ class TestGetForecast:
             }
         )
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await get_forecast_fn(location="London")
+        result = await get_forecast_fn(location="London")
 
-            assert result["source"] == "one_call"
-            assert "hourly" in result
-            assert "daily" in result
+        assert result["source"] == "one_call"
+        assert "hourly" in result
+        assert "daily" in result
 
     async def test_forecast_free_tier_fallback(self, mock_client: MagicMock) -> None:
         """Test forecast falls back to free tier gracefully."""
@@ -176,24 +150,11 @@ class TestGetForecast:
             }
         )
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await get_forecast_fn(location="London")
-
-            assert result["source"] == "free_tier"
-            assert "note" in result
-            assert "forecast_list" in result
-
-    async def test_forecast_with_lat_lon(self, mock_client: MagicMock) -> None:
-        """Test forecast using direct coordinates."""
-        mock_client.get_forecast_with_fallback = AsyncMock(
-            return_value={"source": "one_call", "hourly": []}
-        )
-
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await get_forecast_fn(lat=51.5, lon=-0.1)
+        result = await get_forecast_fn(location="London")
 
-            mock_client.get_forecast_with_fallback.assert_called_once_with(51.5, -0.1, "metric")
-            assert result["source"] == "one_call"
+        assert result["source"] == "free_tier"
+        assert "note" in result
+        assert "forecast_list" in result
 
 
 class TestCheckAirQuality:
@@ -201,10 +162,9 @@ class TestCheckAirQuality:
 
     async def test_air_quality_by_location(self, mock_client: MagicMock) -> None:
         """Test getting air quality data by location string."""
-        mock_aq = MagicMock()
-        mock_aq.model_dump.return_value = {
+        mock_aq = {
             "coord": {"lat": 51.5, "lon": -0.1},
-            "items": [
+            "list": [
                 {
                     "main": {"aqi": 2},
                     "components": {"pm2_5": 12.5, "pm10": 25.0, "o3": 45.0},
@@ -213,29 +173,12 @@ class TestCheckAirQuality:
         }
 
         mock_client.resolve_location = AsyncMock(return_value=(51.5, -0.1))
-        mock_client.get_air_quality = AsyncMock(return_value=mock_aq)
-
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await check_air_quality_fn(location="London")
-
-            mock_client.get_air_quality.assert_called_once_with(51.5, -0.1)
-            assert result["items"][0]["main"]["aqi"] == 2
-
-    async def test_air_quality_by_lat_lon(self, mock_client: MagicMock) -> None:
-        """Test getting air quality data by coordinates."""
-        mock_aq = MagicMock()
-        mock_aq.model_dump.return_value = {
-            "coord": {"lat": 35.6, "lon": 139.6},
-            "items": [{"main": {"aqi": 3}}],
-        }
-
-        mock_client.get_air_quality = AsyncMock(return_value=mock_aq)
+        mock_client.get_air_quality_raw = AsyncMock(return_value=mock_aq)
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await check_air_quality_fn(lat=35.6, lon=139.6)
+        result = await check_air_quality_fn(location="London")
 
-            mock_client.get_air_quality.assert_called_once_with(35.6, 139.6)
-            assert result["items"][0]["main"]["aqi"] == 3
+        mock_client.get_air_quality_raw.assert_called_once_with(51.5, -0.1)
+        assert result["list"][0]["main"]["aqi"] == 2
 
 
 class TestGetHistoricalWeather:
@@ -243,8 +186,7 @@ class TestGetHistoricalWeather:
 
     async def test_historical_weather_success(self, mock_client: MagicMock) -> None:
         """Test successful historical weather retrieval."""
-        mock_data = MagicMock()
-        mock_data.model_dump.return_value = {
+        mock_data = {
             "lat": 51.5,
             "lon": -0.1,
             "timezone": "Europe/London",
@@ -252,109 +194,269 @@ class TestGetHistoricalWeather:
         }
 
         mock_client.resolve_location = AsyncMock(return_value=(51.5, -0.1))
-        mock_client.get_one_call_timemachine = AsyncMock(return_value=mock_data)
+        mock_client.get_one_call_timemachine_raw = AsyncMock(return_value=mock_data)
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await get_historical_weather_fn(date="2024-01-15", location="London")
+        result = await get_historical_weather_fn(date="2024-01-15", location="London")
 
-            assert result["source"] == "one_call"
-            assert result["lat"] == 51.5
-
-    async def test_historical_weather_with_lat_lon(self, mock_client: MagicMock) -> None:
-        """Test historical weather with direct coordinates."""
-        mock_data = MagicMock()
-        mock_data.model_dump.return_value = {"lat": 51.5, "lon": -0.1}
-
-        mock_client.get_one_call_timemachine = AsyncMock(return_value=mock_data)
-
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await get_historical_weather_fn(date="2024-01-15", lat=51.5, lon=-0.1)
-
-            assert result["source"] == "one_call"
+        assert result["source"] == "one_call"
+        assert result["lat"] == 51.5
+        # Midnight UTC on the requested date
+        mock_client.get_one_call_timemachine_raw.assert_called_once_with(
+            51.5, -0.1, 1705276800, "metric"
+        )
 
     async def test_historical_weather_no_subscription(self, mock_client: MagicMock) -> None:
         """Test helpful error when One Call subscription is missing."""
         mock_client.resolve_location = AsyncMock(return_value=(51.5, -0.1))
-        mock_client.get_one_call_timemachine = AsyncMock(
+        mock_client.get_one_call_timemachine_raw = AsyncMock(
             side_effect=OpenWeatherMapAPIError(401, "Unauthorized")
         )
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await get_historical_weather_fn(date="2024-01-15", location="London")
+        result = await get_historical_weather_fn(date="2024-01-15", location="London")
 
-            assert "error" in result
-            assert "One Call API subscription" in result["error"]
-            assert "subscription_url" in result
+        assert "error" in result
+        assert "One Call API subscription" in result["error"]
+        assert "subscription_url" in result
 
     async def test_historical_weather_invalid_date(self, mock_client: MagicMock) -> None:
         """Test error handling for invalid date format."""
         mock_client.resolve_location = AsyncMock(return_value=(51.5, -0.1))
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            result = await get_historical_weather_fn(date="not-a-date", location="London")
+        result = await get_historical_weather_fn(date="not-a-date", location="London")
+
+        assert "error" in result
+        assert "Invalid date format" in result["error"]
+
+    async def test_historical_weather_impossible_date(self, mock_client: MagicMock) -> None:
+        """Test well-formed but non-existent dates are rejected."""
+        mock_client.resolve_location = AsyncMock(return_value=(51.5, -0.1))
+
+        result = await get_historical_weather_fn(date="2024-02-30", location="London")
 
-            assert "error" in result
-            assert "Invalid date format" in result["error"]
+        assert "Invalid date format" in result["error"]
+
+    async def test_historical_weather_unpadded_date(self, mock_client: MagicMock) -> None:
+        """Test month and day without leading zeros are accepted."""
+        mock_client.resolve_location = AsyncMock(return_value=(51.5, -0.1))
+        mock_client.get_one_call_timemachine_raw = AsyncMock(return_value={"lat": 51.5})
+
+        result = await get_historical_weather_fn(date="2024-1-5", location="London")
+
+        assert result["source"] == "one_call"
+        # Midnight UTC on 2024-01-05
+        mock_client.get_one_call_timemachine_raw.assert_called_once_with(
+            51.5, -0.1, 1704412800, "metric"
+        )
 
     async def test_historical_weather_other_errors_propagate(
         self, mock_client: MagicMock
     ) -> None:
         """Test that non-auth errors are raised."""
         mock_client.resolve_location = AsyncMock(return_value=(51.5, -0.1))
-        mock_client.get_one_call_timemachine = AsyncMock(
+        mock_client.get_one_call_timemachine_raw = AsyncMock(
+            side_effect=OpenWeatherMapAPIError(500, "Server Error")
+        )
+
+        with pytest.raises(OpenWeatherMapAPIError) as exc_info:
+            await get_historical_weather_fn(date="2024-01-15", location="London")
+        assert exc_info.value.status == 500
+
+
+class TestCheckLocationSummary:
+    """Tests for check_location_summary tool."""
+
+    async def test_summary_resolves_location_once(self, mock_client: MagicMock) -> None:
+        """Test the location is geocoded once and all three lookups are combined."""
+        mock_client.resolve_location = AsyncMock(return_value=(51.5, -0.1))
+        mock_client.get_current_weather_raw = AsyncMock(return_value={"main": {"temp": 15.5}})
+        mock_client.get_forecast_with_fallback = AsyncMock(return_value={"source": "free_tier"})
+        mock_client.get_air_quality_raw = AsyncMock(return_value={"list": [{"main": {"aqi": 2}}]})
+
+        result = await check_location_summary_fn(location="London", units="imperial")
+
+        mock_client.resolve_location.assert_called_once_with("London")
+        mock_client.get_current_weather_raw.assert_called_once_with(51.5, -0.1, "imperial")
+        mock_client.get_forecast_with_fallback.assert_called_once_with(51.5, -0.1, "imperial")
+        mock_client.get_air_quality_raw.assert_called_once_with(51.5, -0.1)
+        assert result["weather"]["main"]["temp"] == 15.5
+        assert result["forecast"]["source"] == "free_tier"
+        assert result["air_quality"]["list"][0]["main"]["aqi"] == 2
+
+    async def test_summary_raises_api_error(self, mock_client: MagicMock) -> None:
+        """Test an API failure surfaces as OpenWeatherMapAPIError, not an ExceptionGroup."""
+        mock_client.get_current_weather_raw = AsyncMock(return_value={})
+        mock_client.get_forecast_with_fallback = AsyncMock(return_value={})
+        mock_client.get_air_quality_raw = AsyncMock(
             side_effect=OpenWeatherMapAPIError(500, "Server Error")
         )
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            with pytest.raises(OpenWeatherMapAPIError) as exc_info:
-                await get_historical_weather_fn(date="2024-01-15", location="London")
-            assert exc_info.value.status == 500
+        with pytest.raises(OpenWeatherMapAPIError) as exc_info:
+            await check_location_summary_fn(lat=51.5, lon=-0.1)
+        assert exc_info.value.status == 500
 
 
 class TestLocationResolution:
     """Tests for location handling across tools."""
 
+    @pytest.mark.parametrize(
+        ("tool_fn", "kwargs"),
+        [
+            (check_weather_fn, {}),
+            (get_forecast_fn, {}),
+            (check_air_quality_fn, {}),
+            (get_historical_weather_fn, {"date": "2024-01-15"}),
+            (check_location_summary_fn, {}),
+            (check_weather_fn, {"lat": 20.02}),
+        ],
+    )
+    async def test_missing_location_error(
+        self, mock_client: MagicMock, tool_fn: Any, kwargs: dict[str, Any]
+    ) -> None:
+        """Test error when neither location nor a full lat/lon pair is provided."""
+        with pytest.raises(OpenWeatherMapAPIError) as exc_info:
+            await tool_fn(**kwargs)
+        assert exc_info.value.status == 400
+        assert "Provide either" in exc_info.value.message
+        mock_client.resolve_location.assert_not_called()
+
     async def test_location_not_found_suggests_search(self, mock_client: MagicMock) -> None:
         """Test error message suggests search_location fallback."""
         mock_client.resolve_location = AsyncMock(
             side_effect=OpenWeatherMapAPIError(404, "Location not found: Waimea, HI")
         )
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            with pytest.raises(OpenWeatherMapAPIError) as exc_info:
-                await check_weather_fn(location="Waimea, HI")
-            assert exc_info.value.status == 404
-            assert "search_location" in exc_info.value.message
-
-    async def test_lat_lon_bypasses_location_resolution(self, mock_client: MagicMock) -> None:
+        with pytest.raises(OpenWeatherMapAPIError) as exc_info:
+            await check_weather_fn(location="Waimea, HI")
+        assert exc_info.value.status == 404
+        assert "search_location" in exc_info.value.message
+
+    @pytest.mark.parametrize(
+        ("tool_fn", "client_method", "kwargs", "expected_args"),
+        [
+            (check_weather_fn, "get_current_weather_raw", {}, (20.02, -155.66, "metric")),
+            (get_forecast_fn, "get_forecast_with_fallback", {}, (20.02, -155.66, "metric")),
+            (check_air_quality_fn, "get_air_quality_raw", {}, (20.02, -155.66)),
+            (
+                get_historical_weather_fn,
+                "get_one_call_timemachine_raw",
+                {"date": "2024-01-15"},
+                (20.02, -155.66, 1705276800, "metric"),
+            ),
+        ],
+    )
+    async def test_lat_lon_bypasses_location_resolution(
+        self,
+        mock_client: MagicMock,
+        tool_fn: Any,
+        client_method: str,
+        kwargs: dict[str, Any],
+        expected_args: tuple[Any, ...],
+    ) -> None:
         """Test that lat/lon coordinates skip resolve_location entirely."""
-        mock_weather = MagicMock()
-        mock_weather.model_dump.return_value = {"main": {"temp": 25}}
-
         mock_client.resolve_location = AsyncMock()  # Should not be called
-        mock_client.get_current_weather = AsyncMock(return_value=mock_weather)
+        setattr(mock_client, client_method, AsyncMock(return_value={"lat": 20.02}))
 
-        with patch.object(server, "get_client", return_value=mock_client):
-            await check_weather_fn(lat=20.02, lon=-155.66)
+        await tool_fn(lat=20.02, lon=-155.66, **kwargs)
 
-            mock_client.resolve_location.assert_not_called()
-            mock_client.get_current_weather.assert_called_once_with(20.02, -155.66, "metric")
+        mock_client.resolve_location.assert_not_called()
+        getattr(mock_client, client_method).assert_called_once_with(*expected_args)
+
+
+class TestClientLifecycle:
+    """Tests for the shared client's lifetime."""
+
+    def test_get_client_returns_singleton(self) -> None:
+        """Test tool calls share one long-lived client."""
+        assert server.get_client() is server.get_client()
+
+    async def test_lifespan_opens_and_closes_client(self, mock_client: MagicMock) -> None:
+        """Test the server lifespan opens the shared client at startup and closes it after."""
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        server._client = mock_client
+
+        async with server.lifespan(server.mcp):
+            mock_client.__aenter__.assert_awaited_once()
+            mock_client.__aexit__.assert_not_called()
+
+        mock_client.__aexit__.assert_awaited_once()
+
+    async def test_lifespan_creates_session_eagerly(self) -> None:
+        """Test a real client has its session ready as soon as the server starts."""
+        async with server.lifespan(server.mcp):
+            assert server.get_client()._session is not None
+
+        assert server.get_client()._session is None
 
 
 class TestHealthEndpoint:
     """Tests for the health check endpoint."""
 
     async def test_health_check(self) -> None:
-        """Test health endpoint returns healthy status."""
-        from fastapi import Request
-
+        """Test health endpoint reports a healthy service as compact JSON."""
         mock_request = MagicMock(spec=Request)
         response = await server.health_check(mock_request)
 
         assert response.status_code == 200
-        # JSONResponse body is bytes, decode and check
-        import json
+        assert response.media_type == "application/json"
+        assert response.body == b'{"status":"healthy","service":"mcp-openweathermap"}'
+
+    async def test_health_check_not_modified(self) -> None:
+        """Test probes sending the current ETag get an empty 304."""
+        first = await server.health_check(MagicMock(spec=Request))
+        etag = first.headers["etag"]
+
+        request = MagicMock(spec=Request)
+        request.headers = {"if-none-match": etag}
+        response = await server.health_check(request)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+
+class TestHTTPApp:
+    """Tests for the ASGI application."""
+
+    @pytest.fixture
+    def http_client(self) -> TestClient:
+        """Serve canned responses through the HTTP app's middleware stack."""
+
+        async def large(request: Request) -> Response:
+            return Response(b"x" * 2048, media_type="application/json")
+
+        async def small(request: Request) -> Response:
+            return Response(b"{}", media_type="application/json")
+
+        async def stream(request: Request) -> Response:
+            return Response(b"data: " + b"x" * 2048 + b"\n\n", media_type="text/event-stream")
+
+        app = Starlette(
+            routes=[Route("/large", large), Route("/small", small), Route("/stream", stream)],
+            middleware=server.app.user_middleware,
+        )
+        return TestClient(app)
+
+    def test_gzip_middleware_installed(self) -> None:
+        """Test the HTTP app compresses responses."""
+        assert any(m.cls is GZipMiddleware for m in server.app.user_middleware)
+
+    def test_large_responses_are_gzipped(self, http_client: TestClient) -> None:
+        """Test responses over 1 KB are gzipped for clients that accept it."""
+        response = http_client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.content == b"x" * 2048
+
+    def test_small_responses_are_not_gzipped(self, http_client: TestClient) -> None:
+        """Test responses under the minimum size are sent as-is."""
+        response = http_client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+
+    def test_event_streams_are_not_gzipped(self, http_client: TestClient) -> None:
+        """Test streamable-HTTP event streams are never buffered for compression."""
+        response = http_client.get("/stream", headers={"Accept-Encoding": "gzip"})
 
-        body = json.loads(response.body)
-        assert body["status"] == "healthy"
-        assert body["service"] == "mcp-openweathermap"
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Content-Type"].startswith("text/event-stream")
@@ -0,0 +1,175 @@
+"""Tests for the solar radiation helpers."""
+
+import math
+
+import pytest
+
+from mcp_openweathermap.utils import (
+    calculate_monthly_solar_averages,
+    calculate_solar_radiation_from_weather,
+    create_solar_radiation_response,
+)
+
+
+class TestSeasonalAdjustment:
+    """Tests for the month-based seasonal factor."""
+
+    @pytest.mark.parametrize("month", range(1, 13))
+    @pytest.mark.parametrize(("lat", "peak_month"), [(40.0, 6), (-40.0, 12)])
+    def test_matches_seasonal_cosine(self, lat: float, peak_month: int, month: int) -> None:
+        """Test each month follows the cosine model peaking in the hemisphere's summer."""
+        result = calculate_solar_radiation_from_weather(lat, cloud_cover=0, month=month)
+
+        factor = 1 + 0.3 * math.cos((month - peak_month) * math.pi / 6)
+        assert result["avg_daily_kwh_m2"] == round(3.5 * factor, 2)
+
+    def test_hemispheres_are_opposite(self) -> None:
+        """Test June is the northern peak and the southern minimum."""
+        north = calculate_solar_radiation_from_weather(40.0, cloud_cover=0, month=6)
+        south = calculate_solar_radiation_from_weather(-40.0, cloud_cover=0, month=6)
+
+        assert north["avg_daily_kwh_m2"] == 4.55
+        assert south["avg_daily_kwh_m2"] == 2.45
+
+    @pytest.mark.parametrize("month", [0, 13, -1])
+    def test_month_out_of_range_rejected(self, month: int) -> None:
+        """Test months outside 1-12 raise ValueError instead of indexing past the table."""
+        with pytest.raises(ValueError, match="month must be between 1 and 12"):
+            calculate_solar_radiation_from_weather(8.98, cloud_cover=0, month=month)
+        with pytest.raises(ValueError, match="month must be between 1 and 12"):
+            create_solar_radiation_response("Panama City", 8.98, -79.52, 0, month=month)
+
+    def test_monthly_averages_follow_season(self) -> None:
+        """Test the monthly table uses the same factors as the single-month estimate."""
+        averages = calculate_monthly_solar_averages(40.0, annual_avg_cloud_cover=0)
+
+        assert averages["june"] == 4.55
+        assert averages["december"] == 2.45
+
+
+class TestSolarRadiationFromWeather:
+    """Tests for calculate_solar_radiation_from_weather."""
+
+    def test_tropical_with_uv_and_month(self) -> None:
+        """Test the cloud, UV and seasonal factors combine as before."""
+        result = calculate_solar_radiation_from_weather(8.98, 40, uv_index=9, month=3)
+
+        assert result == {
+            "avg_daily_kwh_m2": 5.77,
+            "peak_sun_hours": 5.77,
+            "cloud_cover_factor": 0.7,
+            "uv_factor": 1.42,
+        }
+
+    def test_uv_factor_is_capped(self) -> None:
+        """Test an extreme UV index is capped at a factor of 1.5."""
+        result = calculate_solar_radiation_from_weather(-33.9, 20, uv_index=12)
+
+        assert result == {
+            "avg_daily_kwh_m2": 5.74,
+            "peak_sun_hours": 5.74,
+            "cloud_cover_factor": 0.85,
+            "uv_factor": 1.5,
+        }
+
+    def test_overcast_temperate(self) -> None:
+        """Test full cloud cover keeps a quarter of the temperate base radiation."""
+        result = calculate_solar_radiation_from_weather(51.5, 100)
+
+        assert result == {
+            "avg_daily_kwh_m2": 0.88,
+            "peak_sun_hours": 0.88,
+            "cloud_cover_factor": 0.25,
+            "uv_factor": 1.0,
+        }
+
+    @pytest.mark.parametrize(
+        ("lat", "expected"),
+        [(0.0, 5.8), (9.99, 5.8), (10.0, 5.5), (-23.4, 5.5), (23.5, 4.5), (35.0, 3.5)],
+    )
+    def test_latitude_zone_boundaries(self, lat: float, expected: float) -> None:
+        """Test each zone's upper bound belongs to the next zone."""
+        result = calculate_solar_radiation_from_weather(lat, 0)
+
+        assert result["avg_daily_kwh_m2"] == expected
+
+
+class TestMonthlySolarAverages:
+    """Tests for calculate_monthly_solar_averages."""
+
+    def test_northern_tropics_default_cloud_cover(self) -> None:
+        """Test the monthly table for Panama with the default 50% cloud cover."""
+        assert calculate_monthly_solar_averages(8.98) == {
+            "january": 2.68,
+            "february": 3.08,
+            "march": 3.62,
+            "april": 4.17,
+            "may": 4.57,
+            "june": 4.71,
+            "july": 4.57,
+            "august": 4.17,
+            "september": 3.62,
+            "october": 3.08,
+            "november": 2.68,
+            "december": 2.54,
+        }
+
+    def test_southern_subtropics(self) -> None:
+        """Test the southern table peaks in December."""
+        assert calculate_monthly_solar_averages(-33.9, 20) == {
+            "january": 4.82,
+            "february": 4.4,
+            "march": 3.82,
+            "april": 3.25,
+            "may": 2.83,
+            "june": 2.68,
+            "july": 2.83,
+            "august": 3.25,
+            "september": 3.82,
+            "october": 4.4,
+            "november": 4.82,
+            "december": 4.97,
+        }
+
+
+class TestCreateSolarRadiationResponse:
+    """Tests for create_solar_radiation_response."""
+
+    def test_response_fields(self) -> None:
+        """Test the response combines the current estimate with the monthly table."""
+        result = create_solar_radiation_response(
+            "Panama City", 8.98, -79.52, 40, uv_index=9, month=3
+        )
+
+        assert result.model_dump() == {
+            "location": "Panama City",
+            "coordinates": {"lat": 8.98, "lon": -79.52},
+            "avg_daily_kwh_m2": 5.77,
+            "peak_sun_hours": 5.77,
+            "monthly_averages": {
+                "january": 3.01,
+                "february": 3.45,
+                "march": 4.06,
+                "april": 4.67,
+                "may": 5.11,
+                "june": 5.28,
+                "july": 5.11,
+                "august": 4.67,
+                "september": 4.06,
+                "october": 3.45,
+                "november": 3.01,
+                "december": 2.84,
+            },
+            "source": "OpenWeatherMap",
+            "cloud_cover_factor": 0.7,
+            "uv_index_avg": 9.0,
+        }
+
+    def test_matches_standalone_helpers(self) -> None:
+        """Test the shared-term fast path agrees with the two public helpers."""
+        result = create_solar_radiation_response("Sydney", -33.9, 151.2, 20, uv_index=4, month=7)
+
+        estimate = calculate_solar_radiation_from_weather(-33.9, 20, uv_index=4, month=7)
+        assert result.avg_daily_kwh_m2 == estimate["avg_daily_kwh_m2"]
+        assert result.cloud_cover_factor == estimate["cloud_cover_factor"]
+        assert result.monthly_averages == calculate_monthly_solar_averages(-33.9, 20)